@@ -14,15 +14,11 @@ if [ -d ".venv" ]; then
 fi
 
 # Set test environment variables
+# Storage paths come from pytest's tmp_path (see tests/conftest.py)
 export VCPKG_STORAGE_TYPE=filesystem
-export VCPKG_STORAGE_PATH=/tmp/vcpkg-harbor-test
 export VCPKG_LOG_LEVEL=DEBUG
 export VCPKG_LOG_FILE=
 
-# Clean up test directory
-rm -rf "$VCPKG_STORAGE_PATH"
-mkdir -p "$VCPKG_STORAGE_PATH"
-
 echo "Running tests..."
 pytest tests/ -v --cov=vcpkg_harbor --cov-report=term-missing --cov-report=html "$@"
 
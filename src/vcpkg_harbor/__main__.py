@@ -7,7 +7,11 @@ from vcpkg_harbor.core.logging import setup_logging
 
 
 def main() -> None:
-    """Run the vcpkg-harbor server."""
+    """Run the vcpkg-harbor server.
+
+    uvicorn picks uvloop and httptools automatically when they are installed,
+    which the ``uvicorn[standard]`` dependency takes care of.
+    """
     settings = get_settings()
     setup_logging(settings)
 
@@ -18,6 +22,8 @@ def main() -> None:
         port=settings.server.port,
         workers=settings.server.workers,
         reload=settings.server.reload,
+        backlog=settings.server.backlog,
+        timeout_keep_alive=settings.server.keep_alive,
         log_config=None,  # Use structlog instead
     )
 
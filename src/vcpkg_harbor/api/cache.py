@@ -2,30 +2,62 @@
 
 import time
 from collections.abc import AsyncIterator
-from typing import Any
+from typing import Annotated, Any
 
 import structlog
-from fastapi import APIRouter, HTTPException, Request, Response
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Path, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
 
 from vcpkg_harbor.core.dependencies import CacheServiceDep, StatsServiceDep
 from vcpkg_harbor.core.exceptions import (
     PackageAlreadyExistsError,
     PackageNotFoundError,
+    ReadOnlyError,
     StorageError,
 )
+from vcpkg_harbor.storage.base import PackageInfo
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(tags=["cache"])
 
+# Path segments map directly onto storage keys, so they are checked once here
+# rather than in every backend: no separators, no "." / "..", no hidden names.
+Segment = Annotated[str, Path(pattern=r"^[^./\\][^/\\]*$")]
+
+# A package is addressed by its ABI hash and never changes once stored, so
+# clients and proxies may keep it for as long as they like.
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _package_headers(info: PackageInfo) -> dict[str, str]:
+    """Build the validator and caching headers shared by HEAD and GET."""
+    headers = {"Cache-Control": CACHE_CONTROL}
+    if info.etag:
+        etag = info.etag if info.etag.startswith('"') else f'"{info.etag}"'
+        headers["ETag"] = etag
+    return headers
+
+
+def _not_modified(request: Request, headers: dict[str, str]) -> bool:
+    """Check whether the client's If-None-Match already names this package."""
+    if_none_match = request.headers.get("if-none-match")
+    etag = headers.get("ETag")
+    if not if_none_match or etag is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
 
 @router.head("/{name}/{version}/{sha}/{triplet}")
 async def check_package(
-    name: str,
-    version: str,
-    sha: str,
-    triplet: str,
+    name: Segment,
+    version: Segment,
+    sha: Segment,
+    triplet: Segment,
+    request: Request,
     cache_service: CacheServiceDep,
     stats_service: StatsServiceDep,
 ) -> Response:
@@ -38,37 +70,37 @@ async def check_package(
         name: Package name
         version: Package version
         sha: Package SHA hash
+        request: FastAPI request object
         cache_service: Injected cache service
         stats_service: Injected stats service
 
     Returns:
         200 OK if package exists
+        304 Not Modified if the client's If-None-Match matches
         404 Not Found if package doesn't exist
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
-        exists = await cache_service.check_exists(name, version, sha, triplet)
-
-        if exists:
-            stats_service.record_cache_hit()
-            stats_service.record_head_request(success=True)
-
-            # Get package info for headers
-            try:
-                info = await cache_service.get_package_info(name, version, sha, triplet)
-                response = Response(status_code=200)
-                response.headers["Content-Length"] = str(info.size)
-                if info.etag:
-                    response.headers["ETag"] = info.etag
-                return response
-            except Exception:
-                return Response(status_code=200)
-        else:
+        # A single stat answers both existence and the response headers
+        try:
+            info = await cache_service.get_package_info(name, version, sha, triplet)
+        except PackageNotFoundError:
             stats_service.record_cache_miss()
             stats_service.record_head_request(success=False)
             raise HTTPException(status_code=404, detail="Package not found")
 
+        stats_service.record_cache_hit()
+        stats_service.record_head_request(success=True)
+
+        headers = _package_headers(info)
+        if _not_modified(request, headers):
+            return Response(status_code=304, headers=headers)
+
+        response = Response(status_code=200, headers=headers)
+        response.headers["Content-Length"] = str(info.size)
+        return response
+
     except HTTPException:
         raise
     except Exception as e:
@@ -83,60 +115,110 @@ async def check_package(
         )
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        elapsed = (time.time() - start_time) * 1000
+        elapsed = (time.perf_counter() - start_time) * 1000
         stats_service.record_request_time(elapsed)
 
 
 @router.get("/{name}/{version}/{sha}/{triplet}")
 async def download_package(
-    name: str,
-    version: str,
-    sha: str,
-    triplet: str,
+    name: Segment,
+    version: Segment,
+    sha: Segment,
+    triplet: Segment,
+    request: Request,
     cache_service: CacheServiceDep,
     stats_service: StatsServiceDep,
-) -> StreamingResponse:
+) -> Response:
     """Download a package from the cache.
 
     This endpoint streams the binary package content to the client.
+    Packages on local disk are sent as files, letting the server use
+    its zero-copy path. A matching If-None-Match is answered with 304
+    without reading the package.
 
     Args:
         name: Package name
         version: Package version
         sha: Package SHA hash
+        request: FastAPI request object
         cache_service: Injected cache service
         stats_service: Injected stats service
 
     Returns:
         Streaming binary response with package content
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
-        # Get package info for headers
+        # A plain GET of a package on local disk needs a single stat, which
+        # gives both the headers and the file to send. A conditional GET is
+        # answered from the package info first, so a 304 never touches the file.
+        conditional = "if-none-match" in request.headers
+        package_file = None
+        if not conditional:
+            package_file = await cache_service.get_package_file(name, version, sha, triplet)
+
+        if package_file is not None:
+            info = package_file.info
+        else:
+            try:
+                info = await cache_service.get_package_info(name, version, sha, triplet)
+            except PackageNotFoundError:
+                stats_service.record_cache_miss()
+                stats_service.record_error()
+                raise HTTPException(status_code=404, detail="Package not found")
+
+        if conditional:
+            headers = _package_headers(info)
+            if _not_modified(request, headers):
+                stats_service.record_cache_hit()
+                return Response(status_code=304, headers=headers)
+            package_file = await cache_service.get_package_file(name, version, sha, triplet)
+            if package_file is not None:
+                info = package_file.info
+
+        def record_download() -> None:
+            stats_service.record_download()
+            stats_service.record_cache_hit()
+
+        headers = _package_headers(info)
+        headers["Content-Length"] = str(info.size)
+        headers["Content-Type"] = "application/octet-stream"
+
+        if package_file is not None:
+            # Passing the stat result stops Starlette from stat'ing the file
+            # again and failing with a 500 if it has gone in between
+            response = FileResponse(
+                package_file.path,
+                media_type="application/octet-stream",
+                headers=headers,
+                background=BackgroundTask(record_download),
+                stat_result=package_file.stat,
+            )
+            # Read in storage-sized blocks instead of Starlette's 64 KiB default
+            response.chunk_size = cache_service.settings.storage.chunk_size
+            return response
+
+        # Read the first chunk before answering, so a package that vanished
+        # since the stat above is still reported as 404 rather than a broken 200
+        chunks = cache_service.get_package(name, version, sha, triplet)
         try:
-            info = await cache_service.get_package_info(name, version, sha, triplet)
-            headers = {
-                "Content-Length": str(info.size),
-                "Content-Type": "application/octet-stream",
-            }
-            if info.etag:
-                headers["ETag"] = info.etag
-        except PackageNotFoundError:
-            stats_service.record_cache_miss()
-            stats_service.record_error()
-            raise HTTPException(status_code=404, detail="Package not found")
+            first_chunk = await anext(chunks)
+        except StopAsyncIteration:
+            first_chunk = b""
 
         # Stream the package content
         async def stream_package() -> AsyncIterator[bytes]:
             try:
-                async for chunk in cache_service.get_package(name, version, sha, triplet):
+                yield first_chunk
+                async for chunk in chunks:
                     yield chunk
-                stats_service.record_download()
-                stats_service.record_cache_hit()
+                record_download()
             except Exception as e:
                 logger.error("Error streaming package", error=str(e))
                 stats_service.record_error()
+            finally:
+                await chunks.aclose()  # type: ignore[attr-defined]
 
         return StreamingResponse(
             stream_package(),
@@ -161,16 +243,16 @@ async def download_package(
         )
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        elapsed = (time.time() - start_time) * 1000
+        elapsed = (time.perf_counter() - start_time) * 1000
         stats_service.record_request_time(elapsed)
 
 
 @router.put("/{name}/{version}/{sha}/{triplet}")
 async def upload_package(
-    name: str,
-    version: str,
-    sha: str,
-    triplet: str,
+    name: Segment,
+    version: Segment,
+    sha: Segment,
+    triplet: Segment,
     request: Request,
     cache_service: CacheServiceDep,
     stats_service: StatsServiceDep,
@@ -191,21 +273,16 @@ async def upload_package(
     Returns:
         JSON response with upload status and details
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         # Get content length if available
         content_length = request.headers.get("content-length")
         size = int(content_length) if content_length else None
 
-        # Stream the request body
-        async def request_stream() -> AsyncIterator[bytes]:
-            async for chunk in request.stream():
-                yield chunk
-
-        # Store the package
+        # Stream the request body straight into storage
         package_info = await cache_service.put_package(
-            name, version, sha, triplet, request_stream(), size
+            name, version, sha, triplet, request.stream(), size
         )
 
         stats_service.record_upload()
@@ -223,10 +300,11 @@ async def upload_package(
     except PackageAlreadyExistsError:
         stats_service.record_error()
         raise HTTPException(status_code=409, detail="Package already exists")
+    except ReadOnlyError as e:
+        stats_service.record_error()
+        raise HTTPException(status_code=403, detail=e.message)
     except StorageError as e:
         stats_service.record_error()
-        if "read-only" in str(e).lower():
-            raise HTTPException(status_code=403, detail="Server is in read-only mode")
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         stats_service.record_error()
@@ -240,16 +318,16 @@ async def upload_package(
         )
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
     finally:
-        elapsed = (time.time() - start_time) * 1000
+        elapsed = (time.perf_counter() - start_time) * 1000
         stats_service.record_request_time(elapsed)
 
 
 @router.delete("/{name}/{version}/{sha}/{triplet}")
 async def delete_package(
-    name: str,
-    version: str,
-    sha: str,
-    triplet: str,
+    name: Segment,
+    version: Segment,
+    sha: Segment,
+    triplet: Segment,
     cache_service: CacheServiceDep,
     stats_service: StatsServiceDep,
 ) -> dict[str, Any]:
@@ -267,7 +345,7 @@ async def delete_package(
     Returns:
         JSON response with deletion status
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         deleted = await cache_service.delete_package(name, version, sha, triplet)
@@ -285,10 +363,11 @@ async def delete_package(
 
     except HTTPException:
         raise
+    except ReadOnlyError as e:
+        stats_service.record_error()
+        raise HTTPException(status_code=403, detail=e.message)
     except StorageError as e:
         stats_service.record_error()
-        if "read-only" in str(e).lower():
-            raise HTTPException(status_code=403, detail="Server is in read-only mode")
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         stats_service.record_error()
@@ -302,5 +381,5 @@ async def delete_package(
         )
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        elapsed = (time.time() - start_time) * 1000
+        elapsed = (time.perf_counter() - start_time) * 1000
         stats_service.record_request_time(elapsed)
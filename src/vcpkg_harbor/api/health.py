@@ -1,10 +1,10 @@
 """Health check endpoints."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, cast
 
 import structlog
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Request
 
 from vcpkg_harbor import __version__
 
@@ -39,7 +39,7 @@ async def health_check(request: Request) -> dict[str, Any]:
     return {
         "status": status,
         "version": __version__,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(UTC).isoformat(),
     }
 
 
@@ -62,21 +62,19 @@ async def readiness_check(request: Request) -> dict[str, Any]:
     all_ready = all(checks.values())
 
     if not all_ready:
-        from fastapi import HTTPException
-
         raise HTTPException(
             status_code=503,
             detail={
                 "status": "not_ready",
                 "checks": checks,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(UTC).isoformat(),
             },
         )
 
     return {
         "status": "ready",
         "checks": checks,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(UTC).isoformat(),
     }
 
 
@@ -92,7 +90,7 @@ async def liveness_check() -> dict[str, Any]:
     """
     return {
         "status": "alive",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(UTC).isoformat(),
     }
 
 
@@ -120,7 +118,7 @@ async def health_details(request: Request) -> dict[str, Any]:
         "status": "healthy" if storage_healthy else "degraded",
         "version": __version__,
         "uptime": uptime,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(UTC).isoformat(),
         "storage": {
             "healthy": storage_healthy,
             "backend": storage_stats.get("backend", "unknown"),
@@ -3,6 +3,11 @@
 import structlog
 from fastapi import APIRouter, Request, Response
 
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+except ImportError:  # pragma: no cover - prometheus_client is a core dependency
+    generate_latest = None  # type: ignore[assignment]
+
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(tags=["metrics"])
@@ -28,9 +33,14 @@ async def prometheus_metrics(request: Request) -> Response:
     Returns:
         Plain text Prometheus metrics
     """
-    try:
-        from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+    if generate_latest is None:
+        logger.warning("prometheus_client not installed")
+        return Response(
+            content="# Prometheus client not installed\n",
+            media_type="text/plain",
+        )
 
+    try:
         # Get our custom metrics
         # stats_service = request.app.state.stats_service
         # storage = request.app.state.storage
@@ -44,12 +54,6 @@ async def prometheus_metrics(request: Request) -> Response:
 
         return Response(content=metrics_output, media_type=CONTENT_TYPE_LATEST)
 
-    except ImportError:
-        logger.warning("prometheus_client not installed")
-        return Response(
-            content="# Prometheus client not installed\n",
-            media_type="text/plain",
-        )
     except Exception as e:
         logger.error("Error generating metrics", error=str(e))
         return Response(
@@ -1,24 +1,26 @@
 """Authentication middleware for vcpkg-harbor."""
 
-from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
 
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 if TYPE_CHECKING:
-    from starlette.requests import Request
-    from starlette.responses import Response
-    from starlette.types import ASGIApp
+    from starlette.types import ASGIApp, Receive, Scope, Send
 
     from vcpkg_harbor.auth.providers import AuthProvider
 
 logger = structlog.get_logger(__name__)
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """Middleware for authenticating requests."""
+class AuthMiddleware:
+    """Middleware for authenticating requests.
+
+    Implemented as plain ASGI rather than ``BaseHTTPMiddleware`` so responses
+    pass through untouched: package downloads keep their zero-copy file path
+    instead of being re-streamed chunk by chunk through the middleware.
+    """
 
     # Paths that don't require authentication
     PUBLIC_PATHS = {
@@ -47,7 +49,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
             provider: Authentication provider to use
             exclude_dashboard: If True, dashboard routes don't require auth
         """
-        super().__init__(app)
+        self.app = app
         self.provider = provider
         self.exclude_dashboard = exclude_dashboard
 
@@ -71,31 +73,32 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
         return False
 
-    async def dispatch(
-        self, request: "Request", call_next: Callable[["Request"], Awaitable["Response"]]
-    ) -> "Response":
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """Process the request and check authentication."""
-        path = request.url.path
+        # Skip auth for non-HTTP traffic and public paths
+        if scope["type"] != "http" or self._is_public_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
-        # Skip auth for public paths
-        if self._is_public_path(path):
-            return await call_next(request)
+        request = Request(scope, receive)
 
         # Authenticate the request
         if not await self.provider.authenticate(request):
             logger.warning(
                 "Authentication failed",
-                path=path,
+                path=request.url.path,
                 method=request.method,
                 client=request.client.host if request.client else "unknown",
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=401,
                 content={"detail": "Authentication required"},
                 headers={"WWW-Authenticate": "Bearer"},
             )
+            await response(scope, receive, send)
+            return
 
         # Add user info to request state
         request.state.user = self.provider.get_user(request)
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -20,6 +20,10 @@ class ServerSettings(BaseSettings):
     port: int = Field(default=15151, description="Port to bind the server to")
     workers: int = Field(default=4, description="Number of worker processes")
     reload: bool = Field(default=False, description="Enable auto-reload for development")
+    backlog: int = Field(default=2048, ge=1, description="Maximum pending connections")
+    keep_alive: int = Field(
+        default=30, ge=1, description="Seconds to keep idle client connections open"
+    )
     read_only: bool = Field(default=False, description="Run server in read-only mode")
     write_only: bool = Field(default=False, description="Run server in write-only mode")
 
@@ -41,6 +45,20 @@ class StorageSettings(BaseSettings):
         default="./cache",
         description="Local path for filesystem storage",
     )
+    chunk_size: int = Field(
+        default=1024 * 1024,
+        gt=0,
+        description="I/O buffer size in bytes for filesystem, MinIO and S3 storage",
+    )
+    local_cache_path: str | None = Field(
+        default=None,
+        description="Directory for a local cache of downloads from remote storage",
+    )
+    local_cache_size: int = Field(
+        default=20 * 1024 * 1024 * 1024,
+        gt=0,
+        description="Capacity of the local download cache in bytes",
+    )
 
 
 class MinioSettings(BaseSettings):
@@ -58,6 +76,20 @@ class MinioSettings(BaseSettings):
     bucket: str = Field(default="vcpkg-harbor", description="MinIO bucket name")
     secure: bool = Field(default=False, description="Use HTTPS for MinIO connection")
     region: str | None = Field(default=None, description="MinIO region")
+    part_size: int = Field(
+        default=50 * 1024 * 1024,
+        ge=5 * 1024 * 1024,
+        description="Multipart upload part size in bytes",
+    )
+    max_concurrency: int = Field(
+        default=4, ge=1, description="Maximum number of parts uploaded in parallel"
+    )
+    io_threads: int = Field(
+        default=16, ge=1, description="Thread pool size for blocking MinIO client calls"
+    )
+    stat_cache_ttl: float = Field(
+        default=60.0, ge=0, description="Seconds to cache object lookups (0 disables)"
+    )
 
 
 class S3Settings(BaseSettings):
@@ -199,9 +231,9 @@ class Settings(BaseSettings):
     def get_storage_config(self) -> dict[str, Any]:
         """Get the configuration for the active storage backend."""
         backend_configs = {
-            "minio": self.minio.model_dump(),
-            "filesystem": {"path": self.storage.path},
-            "s3": self.s3.model_dump(),
+            "minio": {**self.minio.model_dump(), "chunk_size": self.storage.chunk_size},
+            "filesystem": {"path": self.storage.path, "chunk_size": self.storage.chunk_size},
+            "s3": {**self.s3.model_dump(), "chunk_size": self.storage.chunk_size},
             "azure": self.azure.model_dump(),
             "gcs": self.gcs.model_dump(),
         }
@@ -22,15 +22,19 @@ def get_settings_dep() -> Settings:
 SettingsDep = Annotated[Settings, Depends(get_settings_dep)]
 
 
-def get_storage(request: Request) -> "StorageBackend":
-    """Get the storage backend from app state."""
+async def get_storage(request: Request) -> "StorageBackend":
+    """Get the storage backend from app state.
+
+    The state accessors are coroutines so FastAPI resolves them inline; plain
+    def dependencies are dispatched to the threadpool on every request.
+    """
     return cast("StorageBackend", request.app.state.storage)
 
 
 StorageDep = Annotated["StorageBackend", Depends(get_storage)]
 
 
-def get_cache_service(request: Request) -> "CacheService":
+async def get_cache_service(request: Request) -> "CacheService":
     """Get the cache service from app state."""
     return cast("CacheService", request.app.state.cache_service)
 
@@ -38,7 +42,7 @@ def get_cache_service(request: Request) -> "CacheService":
 CacheServiceDep = Annotated["CacheService", Depends(get_cache_service)]
 
 
-def get_stats_service(request: Request) -> "StatsService":
+async def get_stats_service(request: Request) -> "StatsService":
     """Get the stats service from app state."""
     return cast("StatsService", request.app.state.stats_service)
 
@@ -39,6 +39,13 @@ class StorageError(VcpkgHarborError):
         super().__init__(message)
 
 
+class ReadOnlyError(StorageError):
+    """Raised when a write or delete is attempted in read-only mode."""
+
+    def __init__(self) -> None:
+        super().__init__("Server is in read-only mode")
+
+
 class StorageConnectionError(StorageError):
     """Raised when unable to connect to storage backend."""
 
@@ -9,6 +9,11 @@ from typing import TYPE_CHECKING, Any
 import structlog
 from structlog.types import Processor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from vcpkg_harbor.core.config import Settings
 
@@ -17,21 +22,29 @@ def setup_logging(settings: "Settings") -> None:
     """Configure structured logging with structlog."""
     log_level = getattr(logging, settings.logging.level.upper(), logging.INFO)
 
-    # Configure shared processors
+    # Configure shared processors. These run on every emitted event, so only
+    # keep steps that apply to ordinary calls; set_exc_info is a no-op unless
+    # logger.exception() is used.
     shared_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
         structlog.dev.set_exc_info,
         structlog.processors.TimeStamper(fmt="iso"),
     ]
 
+    logger_factory: Any = structlog.PrintLoggerFactory()
+
     if settings.logging.json_format:
-        # JSON format for production
+        # JSON format for production; orjson renders straight to bytes when installed
+        if orjson is not None:
+            renderer = structlog.processors.JSONRenderer(serializer=orjson.dumps)
+            logger_factory = structlog.BytesLoggerFactory()
+        else:
+            renderer = structlog.processors.JSONRenderer()
         processors: list[Processor] = [
             *shared_processors,
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            renderer,
         ]
     else:
         # Console format for development
@@ -45,7 +58,7 @@ def setup_logging(settings: "Settings") -> None:
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
@@ -58,14 +71,14 @@ def setup_logging(settings: "Settings") -> None:
 
     # Set up file logging if configured
     if settings.logging.file:
-        _setup_file_logging(settings)
+        _setup_file_logging(settings, shared_processors)
 
     # Quiet noisy loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.error").setLevel(logging.INFO)
 
 
-def _setup_file_logging(settings: "Settings") -> None:
+def _setup_file_logging(settings: "Settings", shared_processors: list[Processor]) -> None:
     """Set up rotating file logging."""
     if not settings.logging.file:
         return
@@ -80,8 +93,16 @@ def _setup_file_logging(settings: "Settings") -> None:
     )
 
     if settings.logging.json_format:
+        # Render each record to JSON exactly once, with proper escaping
         file_handler.setFormatter(
-            logging.Formatter('{"timestamp":"%(asctime)s","message":"%(message)s"}')
+            structlog.stdlib.ProcessorFormatter(
+                foreign_pre_chain=[*shared_processors, structlog.stdlib.add_logger_name],
+                processors=[
+                    structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                    structlog.processors.format_exc_info,
+                    structlog.processors.JSONRenderer(),
+                ],
+            )
         )
     else:
         file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
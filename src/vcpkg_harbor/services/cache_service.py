@@ -1,13 +1,17 @@
 """Cache service for handling package operations."""
 
+import asyncio
+import os
 from collections.abc import AsyncIterator
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
 
 import structlog
 
 from vcpkg_harbor.core.exceptions import (
     PackageAlreadyExistsError,
     PackageNotFoundError,
+    ReadOnlyError,
     StorageError,
 )
 from vcpkg_harbor.storage.base import PackageInfo
@@ -19,6 +23,15 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
+@dataclass(slots=True)
+class PackageFile:
+    """A package that can be served straight from local disk."""
+
+    path: str
+    stat: os.stat_result
+    info: PackageInfo
+
+
 class CacheService:
     """Service for managing the package cache."""
 
@@ -46,18 +59,16 @@ class CacheService:
         Returns:
             True if package exists, False otherwise
         """
-        logger.debug(
-            "Checking package existence", name=name, version=version, sha=sha, triplet=triplet
-        )
-
         try:
             exists = await self.storage.exists(name, version, sha, triplet)
-            if exists:
-                logger.info("Package exists", name=name, version=version, sha=sha, triplet=triplet)
-            else:
-                logger.info(
-                    "Package not found", name=name, version=version, sha=sha, triplet=triplet
-                )
+            logger.debug(
+                "Checked package existence",
+                name=name,
+                version=version,
+                sha=sha,
+                triplet=triplet,
+                exists=exists,
+            )
             return exists
         except Exception as e:
             logger.error(
@@ -98,12 +109,12 @@ class CacheService:
             )
             raise PackageNotFoundError(name, version, sha, triplet)
 
-        logger.info("Downloading package", name=name, version=version, sha=sha, triplet=triplet)
+        logger.debug("Downloading package", name=name, version=version, sha=sha, triplet=triplet)
 
         try:
             async for chunk in self.storage.get(name, version, sha, triplet):
                 yield chunk
-            logger.info(
+            logger.debug(
                 "Package download complete", name=name, version=version, sha=sha, triplet=triplet
             )
         except PackageNotFoundError:
@@ -122,6 +133,57 @@ class CacheService:
             )
             raise StorageError(f"Error downloading package: {e}", cause=e)
 
+    async def get_package_file(
+        self, name: str, version: str, sha: str, triplet: str
+    ) -> PackageFile | None:
+        """Locate a package as a local file, if the backend stores files on disk.
+
+        The file is stat'ed here, and that one stat provides both the package
+        information and what is needed to serve it. If the file is missing
+        (deleted by another worker, or not or no longer in a local cache),
+        None is returned and the caller falls back to get_package_info() and
+        get_package(), which report a missing package properly.
+
+        Args:
+            name: Package name
+            version: Package version
+            sha: Package SHA hash
+            triplet: Target triplet (e.g., x64-linux, x64-windows)
+
+        Returns:
+            The package file, or None if the package is not available as a
+            local file
+
+        Raises:
+            PackageNotFoundError: If reads are blocked in write-only mode
+        """
+        if self._write_only:
+            raise PackageNotFoundError(name, version, sha, triplet)
+
+        resolve_path = getattr(self.storage, "resolve_path", None)
+        package_info_from_stat = getattr(self.storage, "package_info_from_stat", None)
+        if resolve_path is None or package_info_from_stat is None:
+            return None
+
+        def locate() -> tuple[str, os.stat_result] | None:
+            # resolve_path() may touch the file (local cache LRU), so it runs
+            # off the event loop together with the stat
+            path = cast("str | None", resolve_path(name, version, sha, triplet))
+            if path is None:
+                return None
+            try:
+                return path, os.stat(path)
+            except FileNotFoundError:
+                logger.debug("Package file disappeared before sending", path=path)
+                return None
+
+        located = await asyncio.to_thread(locate)
+        if located is None:
+            return None
+        path, stat = located
+        info = cast("PackageInfo", package_info_from_stat(name, version, sha, triplet, stat))
+        return PackageFile(path=path, stat=stat, info=info)
+
     async def put_package(
         self,
         name: str,
@@ -156,9 +218,9 @@ class CacheService:
                 sha=sha,
                 triplet=triplet,
             )
-            raise StorageError("Server is in read-only mode")
+            raise ReadOnlyError()
 
-        logger.info(
+        logger.debug(
             "Uploading package", name=name, version=version, sha=sha, triplet=triplet, size=size
         )
 
@@ -212,16 +274,16 @@ class CacheService:
                 sha=sha,
                 triplet=triplet,
             )
-            raise StorageError("Server is in read-only mode")
+            raise ReadOnlyError()
 
-        logger.info("Deleting package", name=name, version=version, sha=sha, triplet=triplet)
+        logger.debug("Deleting package", name=name, version=version, sha=sha, triplet=triplet)
 
         try:
             deleted = await self.storage.delete(name, version, sha, triplet)
             if deleted:
                 logger.info("Package deleted", name=name, version=version, sha=sha, triplet=triplet)
             else:
-                logger.info(
+                logger.debug(
                     "Package not found for deletion",
                     name=name,
                     version=version,
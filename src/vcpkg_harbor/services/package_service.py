@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageVersion:
     """Information about a specific package version."""
 
@@ -37,7 +37,7 @@ class PackageVersion:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageSummary:
     """Summary information about a package."""
 
@@ -1,7 +1,8 @@
 """Statistics service for monitoring and metrics."""
 
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
+from functools import partial
 from typing import TYPE_CHECKING
 
 import structlog
@@ -12,7 +13,7 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheStats:
     """Statistics about the cache."""
 
@@ -25,7 +26,7 @@ class CacheStats:
     downloads: int = 0
     errors: int = 0
     backend_type: str = ""
-    last_updated: datetime = field(default_factory=datetime.utcnow)
+    last_updated: datetime = field(default_factory=partial(datetime.now, UTC))
 
     @property
     def total_size_human(self) -> str:
@@ -46,7 +47,7 @@ class CacheStats:
         return (self.cache_hits / total) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestStats:
     """Statistics about requests."""
 
@@ -59,7 +60,7 @@ class RequestStats:
     error_count: int = 0
     avg_response_time_ms: float = 0.0
     requests_per_minute: float = 0.0
-    start_time: datetime = field(default_factory=datetime.utcnow)
+    start_time: datetime = field(default_factory=partial(datetime.now, UTC))
 
 
 class StatsService:
@@ -85,7 +86,7 @@ class StatsService:
         self._delete_requests = 0
         self._success_count = 0
         self._error_count = 0
-        self._start_time = datetime.utcnow()
+        self._start_time = datetime.now(UTC)
 
     def record_cache_hit(self) -> None:
         """Record a cache hit."""
@@ -145,7 +146,7 @@ class StatsService:
                 downloads=self._downloads,
                 errors=self._errors,
                 backend_type=storage_stats.get("backend", "unknown"),
-                last_updated=datetime.utcnow(),
+                last_updated=datetime.now(UTC),
             )
         except Exception as e:
             logger.error("Error getting cache stats", error=str(e))
@@ -165,7 +166,7 @@ class StatsService:
             avg_time = sum(self._request_times) / len(self._request_times)
 
         # Calculate requests per minute
-        uptime = (datetime.utcnow() - self._start_time).total_seconds()
+        uptime = (datetime.now(UTC) - self._start_time).total_seconds()
         rpm = 0.0
         if uptime > 0:
             rpm = (self._request_count / uptime) * 60
@@ -185,7 +186,7 @@ class StatsService:
 
     def get_uptime(self) -> timedelta:
         """Get server uptime."""
-        return datetime.utcnow() - self._start_time
+        return datetime.now(UTC) - self._start_time
 
     def get_uptime_human(self) -> str:
         """Get human-readable uptime."""
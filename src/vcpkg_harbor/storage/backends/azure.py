@@ -2,7 +2,7 @@
 
 import asyncio
 from collections.abc import AsyncIterator
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, cast
 
 import structlog
@@ -120,7 +120,12 @@ class AzureBackend:
             blob_client = self.container_client.get_blob_client(blob_name)
             downloader = await loop.run_in_executor(None, blob_client.download_blob)
 
-            for chunk in downloader.chunks():
+            # Each chunk is a network read, so pull them off the event loop
+            chunks = downloader.chunks()
+            while True:
+                chunk = await loop.run_in_executor(None, next, chunks, None)
+                if chunk is None:
+                    break
                 yield chunk
 
         except PackageNotFoundError:
@@ -160,7 +165,7 @@ class AzureBackend:
                 lambda: blob_client.upload_blob(body, content_type="application/octet-stream"),
             )
 
-            logger.info("Package uploaded", blob=blob_name, size=actual_size)
+            logger.debug("Package uploaded", blob=blob_name, size=actual_size)
 
             return PackageInfo(
                 name=name,
@@ -169,7 +174,7 @@ class AzureBackend:
                 triplet=triplet,
                 size=actual_size,
                 etag=result.get("etag", "").strip('"'),
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(UTC),
             )
 
         except PackageAlreadyExistsError:
@@ -190,7 +195,7 @@ class AzureBackend:
             loop = asyncio.get_event_loop()
             blob_client = self.container_client.get_blob_client(blob_name)
             await loop.run_in_executor(None, blob_client.delete_blob)
-            logger.info("Package deleted", blob=blob_name)
+            logger.debug("Package deleted", blob=blob_name)
             return True
         except Exception as e:
             logger.error("Error deleting package", blob=blob_name, error=str(e))
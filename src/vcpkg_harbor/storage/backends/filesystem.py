@@ -1,9 +1,14 @@
 """Filesystem storage backend implementation."""
 
-import hashlib
+import asyncio
+import contextlib
+import errno
 import os
+import time
+import uuid
+from collections import OrderedDict
 from collections.abc import AsyncIterator
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -20,28 +25,161 @@ from vcpkg_harbor.storage.base import PackageInfo
 
 logger = structlog.get_logger(__name__)
 
+# Flags for named temp files; O_BINARY keeps Windows from translating newlines
+_TEMP_FILE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+)
+
+# Upper bound on chunks per write call, well below any platform's IOV_MAX
+_MAX_WRITE_BATCH = 64
+
+# fdatasync skips flushing inode timestamps; macOS and Windows only have fsync
+_sync_data = getattr(os, "fdatasync", os.fsync)
+
+# Number of package paths remembered as present by exists()
+_EXISTS_CACHE_SIZE = 100_000
+
+# Seconds a package seen on disk is trusted without looking again; other
+# workers sharing the directory may delete it in the meantime
+_EXISTS_CACHE_TTL = 1.0
+
+
+def _write_all(fd: int, chunks: list[bytes]) -> None:
+    """Write chunks to a file descriptor in as few syscalls as possible (blocking)."""
+    if not hasattr(os, "writev"):
+        view = memoryview(b"".join(chunks))
+        while view:
+            view = view[os.write(fd, view) :]
+        return
+
+    buffers: list[bytes | memoryview] = list(chunks)
+    while buffers:
+        written = os.writev(fd, buffers)
+        # Drop fully written buffers and trim a partially written one
+        while buffers and written >= len(buffers[0]):
+            written -= len(buffers.pop(0))
+        if written:
+            buffers[0] = memoryview(buffers[0])[written:]
+
+
+def _sorted_entries(path: str, dirs: bool) -> list[os.DirEntry[str]]:
+    """List the subdirectories or regular files of a directory, sorted by name (blocking)."""
+    with os.scandir(path) as it:
+        if dirs:
+            entries = [entry for entry in it if entry.is_dir()]
+        else:
+            entries = [entry for entry in it if entry.is_file()]
+    entries.sort(key=lambda entry: entry.name)
+    return entries
+
 
 class FilesystemBackend:
     """Local filesystem storage backend."""
 
-    def __init__(self, path: str = "./cache") -> None:
+    def __init__(self, path: str = "./cache", chunk_size: int = 1024 * 1024) -> None:
         """Initialize filesystem backend.
 
         Args:
             path: Base path for storing packages
+            chunk_size: I/O buffer size in bytes for reads and batched writes
+        """
+        # Normalize lexically; the directory is created in initialize() and
+        # may not exist yet, so there is nothing on disk to resolve against.
+        self.base_path = Path(os.path.abspath(path))
+        self._base_str = str(self.base_path)
+        self.chunk_size = chunk_size
+        # Anonymous temp files need O_TMPFILE and /proc to link them into place
+        self._use_tmpfile = hasattr(os, "O_TMPFILE") and os.path.isdir("/proc/self/fd")
+        # Paths recently seen on disk, mapped to when that sighting expires.
+        # Only positive results are cached, and only briefly: deletes by other
+        # processes are not visible to this one.
+        self._known_paths: OrderedDict[str, float] = OrderedDict()
+
+    def _get_package_path(self, name: str, version: str, sha: str, triplet: str) -> str:
+        """Get the full path for a package.
+
+        Built as a plain string: this runs on every request, and chained
+        pathlib joins allocate an intermediate Path per component.
+        """
+        return f"{self._base_str}{os.sep}{name}{os.sep}{version}{os.sep}{sha}{os.sep}{triplet}"
+
+    def resolve_path(self, name: str, version: str, sha: str, triplet: str) -> str:
+        """Get the on-disk path of a package, so it can be served as a file.
+
+        The path is returned whether or not the package exists.
         """
-        self.base_path = Path(path).resolve()
+        return self._get_package_path(name, version, sha, triplet)
 
-    def _get_package_path(self, name: str, version: str, sha: str, triplet: str) -> Path:
-        """Get the full path for a package."""
-        return self.base_path / name / version / sha / triplet
+    def package_info_from_stat(
+        self, name: str, version: str, sha: str, triplet: str, stat: os.stat_result
+    ) -> PackageInfo:
+        """Build package information from a stat of the package file."""
+        return PackageInfo(
+            name=name,
+            version=version,
+            sha=sha,
+            triplet=triplet,
+            size=stat.st_size,
+            etag=self._make_etag(stat),
+            created_at=datetime.fromtimestamp(stat.st_ctime, UTC),
+        )
+
+    def _remember(self, path: str) -> None:
+        """Record a package path as present, evicting the least recently used."""
+        self._known_paths[path] = time.monotonic() + _EXISTS_CACHE_TTL
+        self._known_paths.move_to_end(path)
+        if len(self._known_paths) > _EXISTS_CACHE_SIZE:
+            self._known_paths.popitem(last=False)
+
+    def _is_known(self, path: str) -> bool:
+        """Check whether a package path was seen on disk within the TTL."""
+        expires = self._known_paths.get(path)
+        if expires is None:
+            return False
+        if expires < time.monotonic():
+            del self._known_paths[path]
+            return False
+        self._known_paths.move_to_end(path)
+        return True
+
+    def _forget(self, path: str) -> None:
+        """Drop a package path from the existence cache."""
+        self._known_paths.pop(path, None)
+
+    @staticmethod
+    def _make_etag(stat: os.stat_result) -> str:
+        """Derive an ETag from file metadata without reading the content."""
+        return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+    def _open_anonymous(self, directory: str) -> int | None:
+        """Open an unnamed O_TMPFILE inode in a directory, if supported (blocking)."""
+        if not self._use_tmpfile:
+            return None
+        try:
+            return os.open(directory, os.O_TMPFILE | os.O_WRONLY | os.O_CLOEXEC, 0o644)
+        except OSError as e:
+            if e.errno not in (errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL):
+                raise
+            logger.debug("O_TMPFILE not supported, using named temp files", error=str(e))
+            self._use_tmpfile = False
+            return None
+
+    @staticmethod
+    def _link_anonymous(fd: int, path: str) -> None:
+        """Give an O_TMPFILE inode its final name (blocking).
+
+        A dir_fd makes CPython use linkat() with AT_SYMLINK_FOLLOW, which is
+        needed to link through /proc; the absolute source path means the
+        descriptor itself is never used for lookup.
+        """
+        os.link(f"/proc/self/fd/{fd}", path, src_dir_fd=fd, follow_symlinks=True)
 
     async def initialize(self) -> None:
         """Initialize the filesystem backend."""
         logger.info("Initializing filesystem backend", path=str(self.base_path))
 
         try:
-            self.base_path.mkdir(parents=True, exist_ok=True)
+            await aiofiles.os.makedirs(self.base_path, exist_ok=True)
             logger.debug("Storage directory ready", path=str(self.base_path))
         except Exception as e:
             logger.error("Failed to initialize filesystem backend", error=str(e))
@@ -54,27 +192,35 @@ class FilesystemBackend:
     async def exists(self, name: str, version: str, sha: str, triplet: str) -> bool:
         """Check if a package exists."""
         package_path = self._get_package_path(name, version, sha, triplet)
-        return package_path.exists()
+        if self._is_known(package_path):
+            return True
+
+        exists = await aiofiles.os.path.exists(package_path)
+        if exists:
+            self._remember(package_path)
+        return exists
 
     async def get(self, name: str, version: str, sha: str, triplet: str) -> AsyncIterator[bytes]:
         """Get a package as an async iterator of bytes."""
         package_path = self._get_package_path(name, version, sha, triplet)
-        logger.debug("Getting package", path=str(package_path))
-
-        if not package_path.exists():
-            logger.warning("Package not found", path=str(package_path))
-            raise PackageNotFoundError(name, version, sha, triplet)
+        logger.debug("Getting package", path=package_path)
 
         try:
             async with aiofiles.open(package_path, "rb") as f:
-                chunk_size = 64 * 1024  # 64KB chunks
+                if hasattr(os, "posix_fadvise"):
+                    # Packages are read front to back; ask for aggressive readahead
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
                 while True:
-                    chunk = await f.read(chunk_size)
+                    chunk = await f.read(self.chunk_size)
                     if not chunk:
                         break
                     yield chunk
+        except FileNotFoundError:
+            self._forget(package_path)
+            logger.warning("Package not found", path=package_path)
+            raise PackageNotFoundError(name, version, sha, triplet)
         except Exception as e:
-            logger.error("Error reading package", path=str(package_path), error=str(e))
+            logger.error("Error reading package", path=package_path, error=str(e))
             raise StorageError(f"Error reading package: {e}", cause=e)
 
     async def put(
@@ -88,29 +234,50 @@ class FilesystemBackend:
     ) -> PackageInfo:
         """Store a package."""
         package_path = self._get_package_path(name, version, sha, triplet)
-        logger.debug("Putting package", path=str(package_path))
+        logger.debug("Putting package", path=package_path)
 
-        # Check if already exists
-        if package_path.exists():
-            logger.warning("Package already exists", path=str(package_path))
+        # Check the disk itself rather than the existence cache: refusing an
+        # upload because of a stale sighting would block it for good
+        if await aiofiles.os.path.exists(package_path):
+            self._remember(package_path)
+            logger.warning("Package already exists", path=package_path)
             raise PackageAlreadyExistsError(name, version, sha, triplet)
+        self._forget(package_path)
+
+        package_dir = os.path.dirname(package_path)
+        temp_path: str | None = None
 
         try:
             # Create parent directories
-            package_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write data to file
-            total_size = 0
-            hasher = hashlib.md5()
-
-            async with aiofiles.open(package_path, "wb") as f:
-                async for chunk in data:
-                    await f.write(chunk)
-                    total_size += len(chunk)
-                    hasher.update(chunk)
-
-            etag = hasher.hexdigest()
-            logger.info("Package uploaded", path=str(package_path), size=total_size)
+            await aiofiles.os.makedirs(package_dir, exist_ok=True)
+
+            # Upload into an anonymous O_TMPFILE inode that only gets a name once
+            # complete, or else into a hidden .part sibling, so readers never see
+            # a partial package and publishing never degrades to a copy.
+            fd = await asyncio.to_thread(self._open_anonymous, package_dir)
+            if fd is None:
+                temp_path = os.path.join(package_dir, f".{triplet}.{uuid.uuid4().hex}.part")
+                fd = await asyncio.to_thread(os.open, temp_path, _TEMP_FILE_FLAGS, 0o644)
+
+            try:
+                total_size = await self._write_stream(fd, data)
+                try:
+                    stat = await asyncio.to_thread(
+                        self._finish_upload, fd, None if temp_path else package_path
+                    )
+                except FileExistsError:
+                    # A concurrent upload of the same package won the race
+                    self._remember(package_path)
+                    raise PackageAlreadyExistsError(name, version, sha, triplet)
+                etag = self._make_etag(stat)
+            finally:
+                os.close(fd)
+
+            if temp_path is not None:
+                await aiofiles.os.replace(temp_path, package_path)
+
+            self._remember(package_path)
+            logger.debug("Package uploaded", path=package_path, size=total_size)
 
             return PackageInfo(
                 name=name,
@@ -119,77 +286,108 @@ class FilesystemBackend:
                 triplet=triplet,
                 size=total_size,
                 etag=etag,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(UTC),
             )
 
         except PackageAlreadyExistsError:
             raise
         except Exception as e:
             # Clean up partial file on error
-            if package_path.exists():
-                package_path.unlink()
-            logger.error("Error uploading package", path=str(package_path), error=str(e))
+            if temp_path is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    await aiofiles.os.remove(temp_path)
+            logger.error("Error uploading package", path=package_path, error=str(e))
             raise StorageError(f"Error uploading package: {e}", cause=e)
 
+    def _finish_upload(self, fd: int, link_path: str | None) -> os.stat_result:
+        """Make a written temp file durable and stat it, linking it into place if anonymous.
+
+        Done in one blocking call so the whole step costs a single executor
+        hop. Publishing preserves mtime, so the returned stat matches what
+        stat() reports for the package later.
+        """
+        # Make the content durable before it gets its final name, so a
+        # crash can never leave a truncated package behind
+        _sync_data(fd)
+        stat = os.fstat(fd)
+        if link_path is not None:
+            self._link_anonymous(fd, link_path)
+        return stat
+
+    async def _write_stream(self, fd: int, data: AsyncIterator[bytes]) -> int:
+        """Write a chunk stream to a file descriptor, returning the byte count.
+
+        Chunks are buffered up to ``chunk_size`` and flushed with a single
+        writev() per batch, instead of one executor hop and syscall per chunk.
+        """
+        total_size = 0
+        pending: list[bytes] = []
+        pending_size = 0
+
+        async for chunk in data:
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= self.chunk_size or len(pending) >= _MAX_WRITE_BATCH:
+                await asyncio.to_thread(_write_all, fd, pending)
+                total_size += pending_size
+                pending = []
+                pending_size = 0
+
+        if pending:
+            await asyncio.to_thread(_write_all, fd, pending)
+            total_size += pending_size
+
+        return total_size
+
     async def delete(self, name: str, version: str, sha: str, triplet: str) -> bool:
         """Delete a package."""
         package_path = self._get_package_path(name, version, sha, triplet)
-        logger.debug("Deleting package", path=str(package_path))
-
-        if not package_path.exists():
-            return False
+        logger.debug("Deleting package", path=package_path)
+        self._forget(package_path)
 
         try:
             await aiofiles.os.remove(package_path)
-
-            # Clean up empty parent directories
-            await self._cleanup_empty_dirs(package_path.parent)
-
-            logger.info("Package deleted", path=str(package_path))
-            return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
-            logger.error("Error deleting package", path=str(package_path), error=str(e))
+            logger.error("Error deleting package", path=package_path, error=str(e))
             raise StorageError(f"Error deleting package: {e}", cause=e)
 
-    async def _cleanup_empty_dirs(self, path: Path) -> None:
-        """Remove empty parent directories up to base path."""
-        try:
-            while path != self.base_path and path.exists():
-                if any(path.iterdir()):
-                    break
-                path.rmdir()
-                path = path.parent
-        except Exception:
-            pass  # Ignore cleanup errors
+        # Clean up empty parent directories
+        await asyncio.to_thread(self._cleanup_empty_dirs, os.path.dirname(package_path))
 
-    async def stat(self, name: str, version: str, sha: str, triplet: str) -> PackageInfo:
-        """Get package information."""
-        package_path = self._get_package_path(name, version, sha, triplet)
+        logger.debug("Package deleted", path=package_path)
+        return True
 
-        if not package_path.exists():
-            raise PackageNotFoundError(name, version, sha, triplet)
+    def _cleanup_empty_dirs(self, path: str) -> None:
+        """Remove empty parent directories up to base path (blocking).
 
-        try:
-            stat = package_path.stat()
+        rmdir() refuses non-empty directories, so it doubles as the emptiness
+        check and the walk stops at the first directory still in use.
+        """
+        while path != self._base_str:
+            try:
+                os.rmdir(path)
+            except OSError:
+                break
+            path = os.path.dirname(path)
 
-            # Calculate MD5 for etag
-            hasher = hashlib.md5()
-            async with aiofiles.open(package_path, "rb") as f:
-                while chunk := await f.read(64 * 1024):
-                    hasher.update(chunk)
+    async def stat(self, name: str, version: str, sha: str, triplet: str) -> PackageInfo:
+        """Get package information.
 
-            return PackageInfo(
-                name=name,
-                version=version,
-                sha=sha,
-                triplet=triplet,
-                size=stat.st_size,
-                etag=hasher.hexdigest(),
-                created_at=datetime.fromtimestamp(stat.st_ctime),
-            )
+        Always checks the disk, so HEAD never reports a package another
+        process has deleted; the result refreshes the existence cache.
+        """
+        package_path = self._get_package_path(name, version, sha, triplet)
+        try:
+            stat = await aiofiles.os.stat(package_path)
+            info = self.package_info_from_stat(name, version, sha, triplet, stat)
+            self._remember(package_path)
+            return info
 
-        except PackageNotFoundError:
-            raise
+        except FileNotFoundError:
+            self._forget(package_path)
+            raise PackageNotFoundError(name, version, sha, triplet)
         except Exception as e:
             raise StorageError(f"Error getting package info: {e}", cause=e)
 
@@ -202,55 +400,60 @@ class FilesystemBackend:
         """List packages in storage."""
         logger.debug("Listing packages", prefix=prefix, limit=limit, offset=offset)
 
-        packages = []
-        count = 0
-
         try:
-            # Walk directory structure: base/name/version/sha/triplet
-            for name_dir in sorted(self.base_path.iterdir()):
-                if not name_dir.is_dir():
-                    continue
+            return await asyncio.to_thread(self._scan_packages, prefix, limit, offset)
+        except Exception as e:
+            logger.error("Error listing packages", error=str(e))
+            raise StorageError(f"Error listing packages: {e}", cause=e)
 
-                # Apply prefix filter
-                if prefix and not name_dir.name.startswith(prefix.split("/")[0]):
-                    continue
+    def _scan_packages(
+        self,
+        prefix: str | None,
+        limit: int | None,
+        offset: int,
+    ) -> list[PackageInfo]:
+        """Walk the storage tree and collect packages (blocking).
 
-                for version_dir in sorted(name_dir.iterdir()):
-                    if not version_dir.is_dir():
-                        continue
+        Uses scandir so directory/file checks come from the entry type
+        returned by the directory read instead of a stat() per entry.
+        """
+        packages = []
+        count = 0
+        name_prefix = prefix.split("/")[0] if prefix else None
+
+        # Walk directory structure: base/name/version/sha/triplet
+        for name_dir in _sorted_entries(self._base_str, dirs=True):
+            # Apply prefix filter
+            if name_prefix and not name_dir.name.startswith(name_prefix):
+                continue
+
+            for version_dir in _sorted_entries(name_dir.path, dirs=True):
+                for sha_dir in _sorted_entries(version_dir.path, dirs=True):
+                    for triplet_file in _sorted_entries(sha_dir.path, dirs=False):
+                        # Skip in-progress uploads (hidden .part files)
+                        if triplet_file.name.startswith("."):
+                            continue
 
-                    for sha_dir in sorted(version_dir.iterdir()):
-                        if not sha_dir.is_dir():
+                        count += 1
+                        if count <= offset:
                             continue
 
-                        for triplet_file in sorted(sha_dir.iterdir()):
-                            if not triplet_file.is_file():
-                                continue
-
-                            count += 1
-                            if count <= offset:
-                                continue
-
-                            stat = triplet_file.stat()
-                            packages.append(
-                                PackageInfo(
-                                    name=name_dir.name,
-                                    version=version_dir.name,
-                                    sha=sha_dir.name,
-                                    triplet=triplet_file.name,
-                                    size=stat.st_size,
-                                    created_at=datetime.fromtimestamp(stat.st_ctime),
-                                )
+                        stat = triplet_file.stat()
+                        packages.append(
+                            PackageInfo(
+                                name=name_dir.name,
+                                version=version_dir.name,
+                                sha=sha_dir.name,
+                                triplet=triplet_file.name,
+                                size=stat.st_size,
+                                created_at=datetime.fromtimestamp(stat.st_ctime, UTC),
                             )
+                        )
 
-                            if limit and len(packages) >= limit:
-                                return packages
+                        if limit and len(packages) >= limit:
+                            return packages
 
-            return packages
-
-        except Exception as e:
-            logger.error("Error listing packages", error=str(e))
-            raise StorageError(f"Error listing packages: {e}", cause=e)
+        return packages
 
     async def get_stats(self) -> dict[str, Any]:
         """Get storage statistics."""
@@ -260,7 +463,7 @@ class FilesystemBackend:
             package_names = {p.name for p in packages}
 
             # Get disk usage
-            stat = os.statvfs(self.base_path)
+            stat = await aiofiles.os.statvfs(self.base_path)
             disk_free = stat.f_frsize * stat.f_bavail
             disk_total = stat.f_frsize * stat.f_blocks
 
@@ -283,11 +486,14 @@ class FilesystemBackend:
     async def health_check(self) -> bool:
         """Check if filesystem storage is healthy."""
         try:
-            # Check if directory exists and is writable
-            test_file = self.base_path / ".health_check"
-            test_file.write_text("ok")
-            test_file.unlink()
+            await asyncio.to_thread(self._check_writable)
             return True
         except Exception as e:
             logger.warning("Health check failed", error=str(e))
             return False
+
+    def _check_writable(self) -> None:
+        """Check that the storage directory exists and is writable (blocking)."""
+        test_file = self.base_path / ".health_check"
+        test_file.write_text("ok")
+        test_file.unlink()
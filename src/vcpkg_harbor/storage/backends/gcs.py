@@ -2,7 +2,7 @@
 
 import asyncio
 from collections.abc import AsyncIterator
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, cast
 
 import structlog
@@ -162,7 +162,7 @@ class GCSBackend:
             # Reload to get metadata
             await loop.run_in_executor(None, blob.reload)
 
-            logger.info("Package uploaded", blob=blob_name, size=actual_size)
+            logger.debug("Package uploaded", blob=blob_name, size=actual_size)
 
             return PackageInfo(
                 name=name,
@@ -171,7 +171,7 @@ class GCSBackend:
                 triplet=triplet,
                 size=actual_size,
                 etag=blob.etag,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(UTC),
             )
 
         except PackageAlreadyExistsError:
@@ -192,7 +192,7 @@ class GCSBackend:
             loop = asyncio.get_event_loop()
             blob = self.bucket.blob(blob_name)
             await loop.run_in_executor(None, blob.delete)
-            logger.info("Package deleted", blob=blob_name)
+            logger.debug("Package deleted", blob=blob_name)
             return True
         except Exception as e:
             logger.error("Error deleting package", blob=blob_name, error=str(e))
@@ -1,14 +1,23 @@
 """MinIO storage backend implementation."""
 
 import asyncio
-from collections.abc import AsyncIterator
-from datetime import datetime
+import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from functools import partial
 from io import BytesIO
-from typing import Any
+from typing import Any, TypeVar
 
+import certifi
 import structlog
+import urllib3
 from minio import Minio
+from minio.datatypes import Part
 from minio.error import S3Error
+from minio.helpers import DictType
 
 from vcpkg_harbor.core.exceptions import (
     PackageAlreadyExistsError,
@@ -20,6 +29,15 @@ from vcpkg_harbor.storage.base import PackageInfo
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+# Upper bound on cached stat results (entries are a few hundred bytes each)
+_STAT_CACHE_SIZE = 10_000
+
+# Seconds a missing object is cached: another worker may upload it at any
+# time, and a stale miss makes clients rebuild or re-upload the package
+_MISS_CACHE_TTL = 2.0
+
 
 class MinioBackend:
     """MinIO/S3-compatible storage backend."""
@@ -32,6 +50,11 @@ class MinioBackend:
         bucket: str = "vcpkg-harbor",
         secure: bool = False,
         region: str | None = None,
+        chunk_size: int = 1024 * 1024,
+        part_size: int = 50 * 1024 * 1024,
+        max_concurrency: int = 4,
+        io_threads: int = 16,
+        stat_cache_ttl: float = 60.0,
     ) -> None:
         """Initialize MinIO backend.
 
@@ -42,6 +65,12 @@ class MinioBackend:
             bucket: Bucket name for storing packages
             secure: Use HTTPS if True
             region: Optional region for the bucket
+            chunk_size: Read size in bytes for streamed downloads
+            part_size: Part size in bytes for multipart uploads
+            max_concurrency: Maximum number of parts uploaded in parallel
+            io_threads: Size of the thread pool running blocking MinIO calls
+            stat_cache_ttl: Seconds to cache object stat results (0 disables);
+                misses are cached for at most two seconds
         """
         self.endpoint = endpoint
         self.access_key = access_key
@@ -49,36 +78,127 @@ class MinioBackend:
         self.bucket = bucket
         self.secure = secure
         self.region = region
+        self.chunk_size = chunk_size
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self.io_threads = io_threads
+        self.stat_cache_ttl = stat_cache_ttl
+        self._stat_cache: OrderedDict[str, tuple[float, PackageInfo | None]] = OrderedDict()
         self._client: Minio | None = None
+        self._http: urllib3.PoolManager | None = None
+        self._executor: ThreadPoolExecutor | None = None
 
     @property
     def client(self) -> Minio:
         """Get the MinIO client, creating it if necessary."""
         if self._client is None:
+            self._http = self._make_http_client()
             self._client = Minio(
                 self.endpoint,
                 access_key=self.access_key,
                 secret_key=self.secret_key,
                 secure=self.secure,
                 region=self.region,
+                http_client=self._http,
             )
         return self._client
 
+    def _make_http_client(self) -> urllib3.PoolManager:
+        """Create the connection pool used by the MinIO client.
+
+        Mirrors the client's own defaults, but sizes the pool to the I/O thread
+        pool: with the default of 10 connections, calls beyond the tenth open a
+        fresh connection and throw it away afterwards.
+        """
+        timeout = 5 * 60
+        return urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            maxsize=self.io_threads,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(
+                total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]
+            ),
+        )
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool for blocking MinIO calls, creating it if necessary."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.io_threads, thread_name_prefix="minio-io"
+            )
+        return self._executor
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking MinIO SDK call in the backend's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
     def _get_object_path(self, name: str, version: str, sha: str, triplet: str) -> str:
         """Generate object path from package details."""
         return f"{name}/{version}/{sha}/{triplet}"
 
+    def _remember(self, object_path: str, info: PackageInfo | None) -> None:
+        """Cache a stat result, evicting the least recently stored entry."""
+        if self.stat_cache_ttl <= 0:
+            return
+        ttl = self.stat_cache_ttl if info is not None else min(self.stat_cache_ttl, _MISS_CACHE_TTL)
+        self._stat_cache[object_path] = (time.monotonic() + ttl, info)
+        self._stat_cache.move_to_end(object_path)
+        if len(self._stat_cache) > _STAT_CACHE_SIZE:
+            self._stat_cache.popitem(last=False)
+
+    def _forget(self, object_path: str) -> None:
+        """Drop an object from the stat cache."""
+        self._stat_cache.pop(object_path, None)
+
+    async def _lookup(self, name: str, version: str, sha: str, triplet: str) -> PackageInfo | None:
+        """Stat an object, answering from the cache while the entry is fresh.
+
+        Missing objects are cached too, but only for a couple of seconds, so
+        bursts of HEAD requests for a package that was never uploaded do not
+        each cost a round-trip to MinIO.
+
+        Returns:
+            PackageInfo, or None if the object does not exist
+        """
+        object_path = self._get_object_path(name, version, sha, triplet)
+        cached = self._stat_cache.get(object_path)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        try:
+            stat = await self._run(self.client.stat_object, self.bucket, object_path)
+        except S3Error as e:
+            if e.code != "NoSuchKey":
+                raise
+            self._remember(object_path, None)
+            return None
+
+        info = PackageInfo(
+            name=name,
+            version=version,
+            sha=sha,
+            triplet=triplet,
+            size=stat.size or 0,
+            etag=stat.etag,
+            content_type=stat.content_type or "application/octet-stream",
+            created_at=stat.last_modified,
+        )
+        self._remember(object_path, info)
+        return info
+
     async def initialize(self) -> None:
         """Initialize the MinIO backend and ensure bucket exists."""
         logger.info("Initializing MinIO backend", endpoint=self.endpoint, bucket=self.bucket)
 
         try:
             # Run synchronous MinIO operations in thread pool
-            loop = asyncio.get_event_loop()
-            bucket_exists = await loop.run_in_executor(None, self.client.bucket_exists, self.bucket)
+            bucket_exists = await self._run(self.client.bucket_exists, self.bucket)
 
             if not bucket_exists:
-                await loop.run_in_executor(None, self.client.make_bucket, self.bucket)
+                await self._run(self.client.make_bucket, self.bucket)
                 logger.info("Created bucket", bucket=self.bucket)
             else:
                 logger.debug("Bucket already exists", bucket=self.bucket)
@@ -91,18 +211,18 @@ class MinioBackend:
         """Close the MinIO backend."""
         logger.debug("Closing MinIO backend")
         self._client = None
+        if self._http is not None:
+            self._http.clear()
+            self._http = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     async def exists(self, name: str, version: str, sha: str, triplet: str) -> bool:
         """Check if a package exists."""
-        object_path = self._get_object_path(name, version, sha, triplet)
-
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.client.stat_object, self.bucket, object_path)
-            return True
+            return await self._lookup(name, version, sha, triplet) is not None
         except S3Error as e:
-            if e.code == "NoSuchKey":
-                return False
             raise StorageError(f"Error checking package existence: {e}", cause=e)
 
     async def get(self, name: str, version: str, sha: str, triplet: str) -> AsyncIterator[bytes]:
@@ -111,26 +231,25 @@ class MinioBackend:
         logger.debug("Getting package", path=object_path)
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, self.client.get_object, self.bucket, object_path
-            )
+            response = await self._run(self.client.get_object, self.bucket, object_path)
 
+            # Keep one read in flight so the next block is fetched from MinIO
+            # while the current one is being written to the client
+            pending = asyncio.ensure_future(self._run(response.read, self.chunk_size))
             try:
-                # Read in chunks
-                chunk_size = 64 * 1024  # 64KB chunks
-                while True:
-                    chunk = await loop.run_in_executor(None, response.read, chunk_size)
-                    if not chunk:
-                        break
+                while chunk := await pending:
+                    pending = asyncio.ensure_future(self._run(response.read, self.chunk_size))
                     yield chunk
             finally:
+                if not pending.done():
+                    await asyncio.wait([pending])
                 response.close()
                 response.release_conn()
 
         except S3Error as e:
             if e.code == "NoSuchKey":
                 logger.warning("Package not found", path=object_path)
+                self._forget(object_path)
                 raise PackageNotFoundError(name, version, sha, triplet)
             logger.error("Error getting package", path=object_path, error=str(e))
             raise StorageError(f"Error getting package: {e}", cause=e)
@@ -148,42 +267,28 @@ class MinioBackend:
         object_path = self._get_object_path(name, version, sha, triplet)
         logger.debug("Putting package", path=object_path)
 
-        # Check if already exists
+        # Ask MinIO rather than the stat cache: an object deleted by another
+        # replica would otherwise be refused with 409 until the entry expires
+        self._forget(object_path)
         if await self.exists(name, version, sha, triplet):
             logger.warning("Package already exists", path=object_path)
             raise PackageAlreadyExistsError(name, version, sha, triplet)
 
         try:
-            # Collect all data chunks
-            chunks = []
-            async for chunk in data:
-                chunks.append(chunk)
-            body = b"".join(chunks)
-            actual_size = len(body)
-
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: self.client.put_object(
-                    bucket_name=self.bucket,
-                    object_name=object_path,
-                    data=BytesIO(body),
-                    length=actual_size,
-                    content_type="application/octet-stream",
-                ),
-            )
+            etag, actual_size = await self._upload(object_path, data)
+            logger.debug("Package uploaded", path=object_path, size=actual_size)
 
-            logger.info("Package uploaded", path=object_path, size=actual_size)
-
-            return PackageInfo(
+            info = PackageInfo(
                 name=name,
                 version=version,
                 sha=sha,
                 triplet=triplet,
                 size=actual_size,
-                etag=result.etag if hasattr(result, "etag") else None,
-                created_at=datetime.utcnow(),
+                etag=etag,
+                created_at=datetime.now(UTC),
             )
+            self._remember(object_path, info)
+            return info
 
         except PackageAlreadyExistsError:
             raise
@@ -191,18 +296,146 @@ class MinioBackend:
             logger.error("Error uploading package", path=object_path, error=str(e))
             raise StorageError(f"Error uploading package: {e}", cause=e)
 
+    async def _upload(self, object_path: str, data: AsyncIterator[bytes]) -> tuple[str | None, int]:
+        """Stream data into an object, using a multipart upload once it exceeds one part.
+
+        The multipart calls are private methods of the MinIO client (the public
+        API only offers put_object's sequential uploads); pyproject.toml pins
+        minio below 8 so they stay as used here.
+
+        At most ``max_concurrency`` parts are in flight at a time, plus the one
+        being filled, so memory stays bounded by ``part_size * (max_concurrency
+        + 1)`` regardless of the package size. Each part buffer grows as body
+        data arrives and never beyond ``part_size``; nothing is reserved from
+        the client's Content-Length, which could be arbitrary.
+
+        Returns:
+            Tuple of (etag, size) of the stored object
+        """
+        headers: DictType = {"Content-Type": "application/octet-stream"}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks: list[asyncio.Task[Part]] = []
+        upload_id: str | None = None
+
+        buffer = bytearray()
+        filled = 0
+        size = 0
+
+        async def submit(upload_id: str, part: bytearray) -> None:
+            await semaphore.acquire()
+            for task in tasks:
+                if task.done() and task.exception() is not None:
+                    semaphore.release()
+                    task.result()
+            tasks.append(
+                asyncio.create_task(
+                    self._upload_part(object_path, upload_id, len(tasks) + 1, part, semaphore)
+                )
+            )
+
+        try:
+            async for chunk in data:
+                view = memoryview(chunk)
+                size += len(view)
+                while view:
+                    n = min(len(view), self.part_size - filled)
+                    buffer += view[:n]
+                    filled += n
+                    view = view[n:]
+                    if filled < self.part_size:
+                        continue
+                    if upload_id is None:
+                        upload_id = await self._run(
+                            self.client._create_multipart_upload,
+                            self.bucket,
+                            object_path,
+                            headers,
+                        )
+                    await submit(upload_id, buffer)
+                    buffer = bytearray()
+                    filled = 0
+
+            if upload_id is None:
+                # Packages up to one part go in a single request; without an
+                # explicit part size put_object would split anything over
+                # 5 MiB into its own sequential multipart upload
+                result = await self._run(
+                    self.client.put_object,
+                    bucket_name=self.bucket,
+                    object_name=object_path,
+                    data=BytesIO(buffer),
+                    length=filled,
+                    content_type="application/octet-stream",
+                    part_size=self.part_size,
+                )
+                return result.etag, size
+
+            if filled:
+                await submit(upload_id, buffer)
+            parts = await asyncio.gather(*tasks)
+            completed = await self._run(
+                self.client._complete_multipart_upload,
+                self.bucket,
+                object_path,
+                upload_id,
+                parts,
+            )
+            return completed.etag, size
+
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if upload_id is not None:
+                await self._abort_upload(object_path, upload_id)
+            raise
+
+    async def _upload_part(
+        self,
+        object_path: str,
+        upload_id: str,
+        part_number: int,
+        data: bytearray,
+        semaphore: asyncio.Semaphore,
+    ) -> Part:
+        """Upload a single part of a multipart upload and release its slot."""
+        try:
+            etag = await self._run(
+                self.client._upload_part,
+                self.bucket,
+                object_path,
+                data,
+                None,
+                upload_id,
+                part_number,
+            )
+            return Part(part_number, etag)
+        finally:
+            semaphore.release()
+
+    async def _abort_upload(self, object_path: str, upload_id: str) -> None:
+        """Abort a multipart upload so its parts do not linger in the bucket."""
+        try:
+            await self._run(
+                self.client._abort_multipart_upload, self.bucket, object_path, upload_id
+            )
+        except Exception as e:
+            logger.warning("Failed to abort multipart upload", path=object_path, error=str(e))
+
     async def delete(self, name: str, version: str, sha: str, triplet: str) -> bool:
         """Delete a package."""
         object_path = self._get_object_path(name, version, sha, triplet)
         logger.debug("Deleting package", path=object_path)
 
+        # Always ask MinIO: another replica may have uploaded since we cached a miss
+        self._forget(object_path)
         if not await self.exists(name, version, sha, triplet):
             return False
 
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.client.remove_object, self.bucket, object_path)
-            logger.info("Package deleted", path=object_path)
+            await self._run(self.client.remove_object, self.bucket, object_path)
+            self._remember(object_path, None)
+            logger.debug("Package deleted", path=object_path)
             return True
         except Exception as e:
             logger.error("Error deleting package", path=object_path, error=str(e))
@@ -210,30 +443,15 @@ class MinioBackend:
 
     async def stat(self, name: str, version: str, sha: str, triplet: str) -> PackageInfo:
         """Get package information."""
-        object_path = self._get_object_path(name, version, sha, triplet)
-
         try:
-            loop = asyncio.get_event_loop()
-            stat = await loop.run_in_executor(
-                None, self.client.stat_object, self.bucket, object_path
-            )
-
-            return PackageInfo(
-                name=name,
-                version=version,
-                sha=sha,
-                triplet=triplet,
-                size=stat.size or 0,
-                etag=stat.etag,
-                content_type=stat.content_type or "application/octet-stream",
-                created_at=stat.last_modified,
-            )
-
+            info = await self._lookup(name, version, sha, triplet)
         except S3Error as e:
-            if e.code == "NoSuchKey":
-                raise PackageNotFoundError(name, version, sha, triplet)
             raise StorageError(f"Error getting package info: {e}", cause=e)
 
+        if info is None:
+            raise PackageNotFoundError(name, version, sha, triplet)
+        return info
+
     async def list_packages(
         self,
         prefix: str | None = None,
@@ -244,40 +462,50 @@ class MinioBackend:
         logger.debug("Listing packages", prefix=prefix, limit=limit, offset=offset)
 
         try:
-            loop = asyncio.get_event_loop()
-            objects = await loop.run_in_executor(
-                None,
-                lambda: list(self.client.list_objects(self.bucket, prefix=prefix, recursive=True)),
-            )
-
-            packages: list[PackageInfo] = []
-            for i, obj in enumerate(objects):
-                if i < offset:
-                    continue
-                if limit and len(packages) >= limit:
-                    break
-
-                # Parse object path (name/version/sha/triplet)
-                parts = obj.object_name.split("/")
-                if len(parts) >= 4:
-                    packages.append(
-                        PackageInfo(
-                            name=parts[0],
-                            version=parts[1],
-                            sha=parts[2],
-                            triplet=parts[3],
-                            size=obj.size,
-                            etag=obj.etag,
-                            created_at=obj.last_modified,
-                        )
-                    )
-
-            return packages
+            return await self._run(self._scan_packages, prefix, limit, offset)
 
         except Exception as e:
             logger.error("Error listing packages", error=str(e))
             raise StorageError(f"Error listing packages: {e}", cause=e)
 
+    def _scan_packages(
+        self,
+        prefix: str | None,
+        limit: int | None,
+        offset: int,
+    ) -> list[PackageInfo]:
+        """Walk the bucket listing and collect packages (blocking).
+
+        The listing is consumed lazily, so a limited page stops requesting
+        further ListObjectsV2 pages as soon as it is full.
+        """
+        packages: list[PackageInfo] = []
+        objects = self.client.list_objects(self.bucket, prefix=prefix, recursive=True)
+
+        for i, obj in enumerate(objects):
+            if i < offset:
+                continue
+
+            # Parse object path (name/version/sha/triplet)
+            parts = (obj.object_name or "").split("/")
+            if len(parts) >= 4:
+                packages.append(
+                    PackageInfo(
+                        name=parts[0],
+                        version=parts[1],
+                        sha=parts[2],
+                        triplet=parts[3],
+                        size=obj.size or 0,
+                        etag=obj.etag,
+                        created_at=obj.last_modified,
+                    )
+                )
+
+            if limit and len(packages) >= limit:
+                break
+
+        return packages
+
     async def get_stats(self) -> dict[str, Any]:
         """Get storage statistics."""
         try:
@@ -305,8 +533,7 @@ class MinioBackend:
     async def health_check(self) -> bool:
         """Check if MinIO is healthy."""
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.client.bucket_exists, self.bucket)
+            await self._run(self.client.bucket_exists, self.bucket)
             return True
         except Exception as e:
             logger.warning("Health check failed", error=str(e))
@@ -2,7 +2,7 @@
 
 import asyncio
 from collections.abc import AsyncIterator
-from datetime import datetime
+from datetime import UTC, datetime
 from io import BytesIO
 from typing import Any
 
@@ -29,6 +29,7 @@ class S3Backend:
         access_key_id: str | None = None,
         secret_access_key: str | None = None,
         endpoint_url: str | None = None,
+        chunk_size: int = 1024 * 1024,
     ) -> None:
         """Initialize S3 backend.
 
@@ -38,12 +39,14 @@ class S3Backend:
             access_key_id: AWS access key ID (uses default credentials if not provided)
             secret_access_key: AWS secret access key
             endpoint_url: Custom S3 endpoint URL (for S3-compatible services)
+            chunk_size: Read size in bytes for streamed downloads
         """
         self.bucket = bucket
         self.region = region
         self.access_key_id = access_key_id
         self.secret_access_key = secret_access_key
         self.endpoint_url = endpoint_url
+        self.chunk_size = chunk_size
         self._client = None
 
     @property
@@ -131,11 +134,10 @@ class S3Backend:
             )
 
             body = response["Body"]
-            chunk_size = 64 * 1024
 
             try:
                 while True:
-                    chunk = await loop.run_in_executor(None, body.read, chunk_size)
+                    chunk = await loop.run_in_executor(None, body.read, self.chunk_size)
                     if not chunk:
                         break
                     yield chunk
@@ -184,7 +186,7 @@ class S3Backend:
                 ),
             )
 
-            logger.info("Package uploaded", key=key, size=actual_size)
+            logger.debug("Package uploaded", key=key, size=actual_size)
 
             return PackageInfo(
                 name=name,
@@ -193,7 +195,7 @@ class S3Backend:
                 triplet=triplet,
                 size=actual_size,
                 etag=result.get("ETag", "").strip('"'),
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(UTC),
             )
 
         except PackageAlreadyExistsError:
@@ -216,7 +218,7 @@ class S3Backend:
                 None,
                 lambda: self.client.delete_object(Bucket=self.bucket, Key=key),
             )
-            logger.info("Package deleted", key=key)
+            logger.debug("Package deleted", key=key)
             return True
         except Exception as e:
             logger.error("Error deleting package", key=key, error=str(e))
@@ -259,44 +261,53 @@ class S3Backend:
         logger.debug("Listing packages", prefix=prefix, limit=limit, offset=offset)
 
         try:
-            paginator = self.client.get_paginator("list_objects_v2")
-
-            kwargs = {"Bucket": self.bucket}
-            if prefix:
-                kwargs["Prefix"] = prefix
-
-            packages = []
-            count = 0
-
-            for page in paginator.paginate(**kwargs):
-                for obj in page.get("Contents", []):
-                    count += 1
-                    if count <= offset:
-                        continue
-
-                    parts = obj["Key"].split("/")
-                    if len(parts) >= 4:
-                        packages.append(
-                            PackageInfo(
-                                name=parts[0],
-                                version=parts[1],
-                                sha=parts[2],
-                                triplet=parts[3],
-                                size=obj["Size"],
-                                etag=obj.get("ETag", "").strip('"'),
-                                created_at=obj.get("LastModified"),
-                            )
-                        )
-
-                    if limit and len(packages) >= limit:
-                        return packages
-
-            return packages
-
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self._scan_packages, prefix, limit, offset)
         except Exception as e:
             logger.error("Error listing packages", error=str(e))
             raise StorageError(f"Error listing packages: {e}", cause=e)
 
+    def _scan_packages(
+        self,
+        prefix: str | None,
+        limit: int | None,
+        offset: int,
+    ) -> list[PackageInfo]:
+        """Page through the bucket listing and collect packages (blocking)."""
+        paginator = self.client.get_paginator("list_objects_v2")
+
+        kwargs = {"Bucket": self.bucket}
+        if prefix:
+            kwargs["Prefix"] = prefix
+
+        packages = []
+        count = 0
+
+        for page in paginator.paginate(**kwargs):
+            for obj in page.get("Contents", []):
+                count += 1
+                if count <= offset:
+                    continue
+
+                parts = obj["Key"].split("/")
+                if len(parts) >= 4:
+                    packages.append(
+                        PackageInfo(
+                            name=parts[0],
+                            version=parts[1],
+                            sha=parts[2],
+                            triplet=parts[3],
+                            size=obj["Size"],
+                            etag=obj.get("ETag", "").strip('"'),
+                            created_at=obj.get("LastModified"),
+                        )
+                    )
+
+                if limit and len(packages) >= limit:
+                    return packages
+
+        return packages
+
     async def get_stats(self) -> dict[str, Any]:
         """Get storage statistics."""
         try:
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Any, Protocol, runtime_checkable
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageInfo:
     """Information about a cached package."""
 
@@ -0,0 +1,342 @@
+"""Local disk cache in front of remote storage backends."""
+
+import asyncio
+import contextlib
+import dataclasses
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import aiofiles
+import structlog
+
+from vcpkg_harbor.storage.base import PackageInfo
+
+if TYPE_CHECKING:
+    from vcpkg_harbor.storage.base import StorageBackend
+
+logger = structlog.get_logger(__name__)
+
+_TEMP_FILE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+)
+
+# Partial downloads older than this are left over from a crashed worker
+_STALE_PART_AGE = 60 * 60
+
+# Eviction trims the cache to this fraction of its capacity, so it does not
+# have to run again after every single download
+_EVICT_TARGET = 0.9
+
+
+def _write_chunk(fd: int, chunk: bytes) -> None:
+    """Write a whole chunk to a file descriptor (blocking)."""
+    view = memoryview(chunk)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _finish_temp_file(fd: int, temp_path: str, package_path: str | None) -> None:
+    """Close a partial download and move it into place, or discard it if no path (blocking)."""
+    os.close(fd)
+    if package_path is not None:
+        os.replace(temp_path, package_path)
+    else:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+
+
+class LocalCacheBackend:
+    """Read-through cache of downloaded packages on local disk.
+
+    Wraps a remote backend (MinIO, S3, Azure, GCS). Downloads that miss the
+    cache are streamed from the remote backend and written to disk as they
+    pass through; later downloads are served from the local file. Everything
+    else is delegated to the remote backend.
+
+    The directory itself is the index: file modification times serve as the
+    LRU clock, so several worker processes can share one cache directory.
+
+    Package metadata is answered from the local file on a hit. So that hits
+    and misses agree, the ETag is derived from the package hash and size
+    rather than taken from the remote backend.
+    """
+
+    def __init__(
+        self,
+        backend: "StorageBackend",
+        path: str,
+        max_size: int,
+        chunk_size: int = 1024 * 1024,
+    ) -> None:
+        """Initialize the local cache.
+
+        Args:
+            backend: Remote storage backend to cache
+            path: Directory holding cached packages
+            max_size: Capacity of the cache in bytes
+            chunk_size: Read size in bytes for cached downloads
+        """
+        self.backend = backend
+        self.base_path = Path(os.path.abspath(path))
+        self._base_str = str(self.base_path)
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        # Estimated bytes on disk; corrected by every eviction scan
+        self._size = 0
+        self._filling: set[str] = set()
+        self._evict_task: asyncio.Task[None] | None = None
+
+    def _get_package_path(self, name: str, version: str, sha: str, triplet: str) -> str:
+        """Generate the local cache path from package details."""
+        return f"{self._base_str}/{name}/{version}/{sha}/{triplet}"
+
+    @staticmethod
+    def _make_etag(sha: str, size: int) -> str:
+        """Derive an ETag that is the same whether a package is cached or not."""
+        return f"{sha}-{size:x}"
+
+    async def initialize(self) -> None:
+        """Initialize the remote backend and take stock of the cache directory."""
+        await self.backend.initialize()
+        await asyncio.to_thread(self.base_path.mkdir, parents=True, exist_ok=True)
+        self._size = await asyncio.to_thread(self._evict)
+        logger.info(
+            "Local package cache enabled",
+            path=self._base_str,
+            max_size=self.max_size,
+            size=self._size,
+        )
+
+    async def close(self) -> None:
+        """Close the remote backend."""
+        if self._evict_task is not None:
+            await self._evict_task
+        await self.backend.close()
+
+    def resolve_path(self, name: str, version: str, sha: str, triplet: str) -> str | None:
+        """Get the local file for a package if it is cached (blocking).
+
+        A hit refreshes the file's modification time, which marks it as
+        recently used.
+
+        Returns:
+            Absolute file path, or None if the package is not cached
+        """
+        path = self._get_package_path(name, version, sha, triplet)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    async def exists(self, name: str, version: str, sha: str, triplet: str) -> bool:
+        """Check if a package exists."""
+        return await self.backend.exists(name, version, sha, triplet)
+
+    async def get(self, name: str, version: str, sha: str, triplet: str) -> AsyncIterator[bytes]:
+        """Get a package, from local disk if cached and otherwise from the backend."""
+        path = await asyncio.to_thread(self.resolve_path, name, version, sha, triplet)
+        if path is not None:
+            try:
+                async with aiofiles.open(path, "rb") as f:
+                    while chunk := await f.read(self.chunk_size):
+                        yield chunk
+                return
+            except FileNotFoundError:
+                # Evicted by another worker since resolve_path() saw it
+                pass
+
+        # Otherwise stream from the backend, copying into the cache on the way
+        package_path = self._get_package_path(name, version, sha, triplet)
+        fd: int | None = None
+        owner = False
+        temp_path = ""
+        size = 0
+
+        # Only one download per package fills the cache; others just stream
+        if package_path not in self._filling:
+            package_dir = os.path.dirname(package_path)
+            temp_path = os.path.join(package_dir, f".{triplet}.{uuid.uuid4().hex}.part")
+            try:
+                await asyncio.to_thread(os.makedirs, package_dir, exist_ok=True)
+                fd = await asyncio.to_thread(os.open, temp_path, _TEMP_FILE_FLAGS, 0o644)
+                self._filling.add(package_path)
+                owner = True
+            except OSError as e:
+                logger.warning("Cannot cache package locally", path=package_path, error=str(e))
+
+        complete = False
+        try:
+            chunks = self.backend.get(name, version, sha, triplet)
+            async with contextlib.aclosing(chunks):  # type: ignore[type-var]
+                async for chunk in chunks:
+                    if fd is not None:
+                        try:
+                            await asyncio.to_thread(_write_chunk, fd, chunk)
+                            size += len(chunk)
+                        except OSError as e:
+                            # A full or failing cache disk must not break the download
+                            logger.warning("Local cache write failed", path=temp_path, error=str(e))
+                            await asyncio.to_thread(_finish_temp_file, fd, temp_path, None)
+                            fd = None
+                    yield chunk
+            complete = True
+        finally:
+            if owner:
+                self._filling.discard(package_path)
+            if fd is not None:
+                keep = complete and size <= self.max_size
+                await asyncio.to_thread(
+                    _finish_temp_file, fd, temp_path, package_path if keep else None
+                )
+                if keep:
+                    self._record(size)
+
+    def _record(self, size: int) -> None:
+        """Account for a newly cached package, evicting in the background if full."""
+        self._size += size
+        if self._size > self.max_size and self._evict_task is None:
+            self._evict_task = asyncio.get_running_loop().create_task(self._evict_async())
+
+    async def _evict_async(self) -> None:
+        """Run an eviction scan off the event loop."""
+        try:
+            self._size = await asyncio.to_thread(self._evict)
+        except Exception as e:
+            logger.warning("Local cache eviction failed", error=str(e))
+        finally:
+            self._evict_task = None
+
+    def _evict(self) -> int:
+        """Remove least recently used packages until under the target size (blocking).
+
+        Also clears out partial downloads left behind by crashed workers.
+
+        Returns:
+            Bytes remaining in the cache
+        """
+        entries: list[tuple[float, int, str]] = []
+        now = time.time()
+        for root, _dirs, files in os.walk(self._base_str):
+            for file in files:
+                path = os.path.join(root, file)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                if file.endswith(".part"):
+                    if now - st.st_mtime > _STALE_PART_AGE:
+                        with contextlib.suppress(FileNotFoundError):
+                            os.remove(path)
+                        self._cleanup_empty_dirs(root)
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_size:
+            return total
+
+        target = self.max_size * _EVICT_TARGET
+        entries.sort()
+        for _, size, path in entries:
+            if total <= target:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            self._cleanup_empty_dirs(os.path.dirname(path))
+            total -= size
+            logger.debug("Evicted package from local cache", path=path, size=size)
+
+        return total
+
+    def _cleanup_empty_dirs(self, path: str) -> None:
+        """Remove empty parent directories up to the cache root (blocking)."""
+        while path != self._base_str:
+            try:
+                os.rmdir(path)
+            except OSError:
+                break
+            path = os.path.dirname(path)
+
+    def _discard(self, name: str, version: str, sha: str, triplet: str) -> int:
+        """Drop a package from the local cache (blocking).
+
+        Returns:
+            Bytes freed
+        """
+        path = self._get_package_path(name, version, sha, triplet)
+        try:
+            size = os.stat(path).st_size
+            os.remove(path)
+        except FileNotFoundError:
+            return 0
+        self._cleanup_empty_dirs(os.path.dirname(path))
+        return size
+
+    async def put(
+        self,
+        name: str,
+        version: str,
+        sha: str,
+        triplet: str,
+        data: AsyncIterator[bytes],
+        size: int | None = None,
+    ) -> PackageInfo:
+        """Store a package in the backend."""
+        info = await self.backend.put(name, version, sha, triplet, data, size)
+        return dataclasses.replace(info, etag=self._make_etag(sha, info.size))
+
+    async def delete(self, name: str, version: str, sha: str, triplet: str) -> bool:
+        """Delete a package from the backend and the local cache."""
+        freed = await asyncio.to_thread(self._discard, name, version, sha, triplet)
+        self._size = max(0, self._size - freed)
+        return await self.backend.delete(name, version, sha, triplet)
+
+    async def stat(self, name: str, version: str, sha: str, triplet: str) -> PackageInfo:
+        """Get package information, from the local file if cached."""
+        path = self._get_package_path(name, version, sha, triplet)
+        try:
+            st = await asyncio.to_thread(os.stat, path)
+        except FileNotFoundError:
+            info = await self.backend.stat(name, version, sha, triplet)
+            return dataclasses.replace(info, etag=self._make_etag(sha, info.size))
+        return self.package_info_from_stat(name, version, sha, triplet, st)
+
+    def package_info_from_stat(
+        self, name: str, version: str, sha: str, triplet: str, stat: os.stat_result
+    ) -> PackageInfo:
+        """Build package information from a stat of the cached file."""
+        return PackageInfo(
+            name=name,
+            version=version,
+            sha=sha,
+            triplet=triplet,
+            size=stat.st_size,
+            etag=self._make_etag(sha, stat.st_size),
+            created_at=datetime.fromtimestamp(stat.st_ctime, UTC),
+        )
+
+    async def list_packages(
+        self,
+        prefix: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[PackageInfo]:
+        """List packages in the backend."""
+        return await self.backend.list_packages(prefix=prefix, limit=limit, offset=offset)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get backend statistics, including local cache usage."""
+        stats = await self.backend.get_stats()
+        stats["local_cache_size_bytes"] = self._size
+        stats["local_cache_max_size_bytes"] = self.max_size
+        return stats
+
+    async def health_check(self) -> bool:
+        """Check if the backend is healthy."""
+        return await self.backend.health_check()
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 import structlog
 
 from vcpkg_harbor.core.exceptions import StorageConfigurationError
+from vcpkg_harbor.storage.local_cache import LocalCacheBackend
 
 if TYPE_CHECKING:
     from vcpkg_harbor.core.config import Settings
@@ -66,7 +67,8 @@ def get_storage_backend(settings: "Settings") -> "StorageBackend":
         settings: Application settings
 
     Returns:
-        Configured storage backend instance
+        Configured storage backend instance, wrapped in a local disk cache
+        if one is configured
 
     Raises:
         StorageConfigurationError: If the backend type is not found
@@ -87,4 +89,15 @@ def get_storage_backend(settings: "Settings") -> "StorageBackend":
         "Creating storage backend", type=backend_type, config_keys=list(backend_config.keys())
     )
 
-    return backend_class(**backend_config)
+    backend = backend_class(**backend_config)
+
+    # Remote backends can keep hot packages on local disk
+    if settings.storage.local_cache_path and backend_type != "filesystem":
+        return LocalCacheBackend(
+            backend,
+            path=settings.storage.local_cache_path,
+            max_size=settings.storage.local_cache_size,
+            chunk_size=settings.storage.chunk_size,
+        )
+
+    return backend
@@ -1,6 +1,8 @@
 """Pytest fixtures for vcpkg-harbor tests."""
 
-import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -8,12 +10,11 @@ from vcpkg_harbor.app import create_app
 from vcpkg_harbor.core.config import Settings
 
 
-@pytest.fixture
-def settings() -> Settings:
-    """Create test settings with filesystem backend."""
+def _make_settings(storage_path: Path) -> Settings:
+    """Build test settings with a filesystem backend under the given path."""
     return Settings(
         server={"host": "127.0.0.1", "port": 15151},
-        storage={"type": "filesystem", "path": "/tmp/vcpkg-harbor-test"},
+        storage={"type": "filesystem", "path": str(storage_path)},
         logging={"level": "DEBUG", "file": None},
         dashboard={"enabled": True},
         metrics={"enabled": True},
@@ -21,6 +22,12 @@ def settings() -> Settings:
     )
 
 
+@pytest.fixture
+def settings(tmp_path) -> Settings:
+    """Create test settings with filesystem backend."""
+    return _make_settings(tmp_path / "storage")
+
+
 @pytest.fixture
 def app(settings: Settings):
     """Create test FastAPI application."""
@@ -30,18 +37,19 @@ def app(settings: Settings):
 @pytest.fixture
 def client(app) -> TestClient:
     """Create test client with lifespan context."""
-    # Clean up test directory before tests
-    import shutil
-    from pathlib import Path
-    test_path = Path("/tmp/vcpkg-harbor-test")
-    if test_path.exists():
-        shutil.rmtree(test_path)
-    test_path.mkdir(parents=True, exist_ok=True)
-    
-    # Use context manager to trigger lifespan events
+    # Storage lives under pytest's tmp_path, which is cleaned up across sessions
+    # rather than with an rmtree around every test
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def routing_client(tmp_path_factory) -> Iterator[TestClient]:
+    """Create one test client shared by tests whose requests never reach storage.
+
+    For checks such as path validation, starting the application once per
+    session is enough; tests that store packages use the per-test client.
+    """
+    app = create_app(_make_settings(tmp_path_factory.mktemp("storage")))
     with TestClient(app) as client:
         yield client
-    
-    # Clean up after tests
-    if test_path.exists():
-        shutil.rmtree(test_path)
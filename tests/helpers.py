@@ -0,0 +1,15 @@
+"""Shared helpers for vcpkg-harbor tests."""
+
+from collections.abc import AsyncIterator
+
+
+async def chunk_stream(*parts: bytes, size: int | None = None) -> AsyncIterator[bytes]:
+    """Yield data the way an upload body arrives, as an async stream of chunks.
+
+    Each part is yielded as one chunk, or split into ``size``-byte chunks if
+    a size is given.
+    """
+    for part in parts:
+        step = size or len(part)
+        for i in range(0, len(part), step):
+            yield part[i : i + step]
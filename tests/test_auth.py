@@ -0,0 +1,29 @@
+"""Tests for the authentication middleware."""
+
+from fastapi.testclient import TestClient
+
+from vcpkg_harbor.app import create_app
+
+
+def test_token_auth_guards_cache_routes(settings):
+    """Test that cache routes need the token while health stays public."""
+    settings.auth.enabled = True
+    settings.auth.type = "token"
+    settings.auth.token = "secret"
+    headers = {"Authorization": "Bearer secret"}
+
+    with TestClient(create_app(settings)) as client:
+        assert client.get("/health").status_code == 200
+
+        response = client.put("/test-auth/1.0.0/sha256auth/x64-linux", content=b"data")
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+
+        response = client.put(
+            "/test-auth/1.0.0/sha256auth/x64-linux", content=b"data", headers=headers
+        )
+        assert response.status_code == 200
+
+        response = client.get("/test-auth/1.0.0/sha256auth/x64-linux", headers=headers)
+        assert response.status_code == 200
+        assert response.content == b"data"
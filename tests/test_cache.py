@@ -1,8 +1,12 @@
 """Tests for cache API endpoints."""
 
+import os
+
 import pytest
 from fastapi.testclient import TestClient
 
+from vcpkg_harbor.app import create_app
+
 
 def test_check_nonexistent_package(client: TestClient):
     """Test HEAD request for nonexistent package."""
@@ -35,11 +39,23 @@ def test_upload_and_download_package(client: TestClient):
     # Check exists
     response = client.head("/test-package/1.0.0/sha256abc/x64-linux")
     assert response.status_code == 200
+    assert response.headers["ETag"] == f'"{data["etag"]}"'
 
     # Download
     response = client.get("/test-package/1.0.0/sha256abc/x64-linux")
     assert response.status_code == 200
     assert response.content == test_data
+    assert response.headers["ETag"] == f'"{data["etag"]}"'
+    assert response.headers["Content-Length"] == str(len(test_data))
+
+
+def test_download_package_range(client: TestClient):
+    """Test that filesystem downloads honour Range requests."""
+    client.put("/test-range/1.0.0/sha256rng/x64-linux", content=b"0123456789")
+
+    response = client.get("/test-range/1.0.0/sha256rng/x64-linux", headers={"Range": "bytes=2-5"})
+    assert response.status_code == 206
+    assert response.content == b"2345"
 
 
 def test_upload_duplicate_package(client: TestClient):
@@ -109,3 +125,119 @@ def test_different_triplets(client: TestClient):
     response = client.get("/test-package4/1.0.0/sha256jkl/x64-windows")
     assert response.status_code == 200
     assert response.content == test_data_windows
+
+
+def test_download_revalidation(settings):
+    """Test that downloads are cacheable and revalidate with If-None-Match."""
+
+    with TestClient(create_app(settings)) as client:
+        client.put("/test-etag/1.0.0/sha256etag/x64-linux", content=b"data")
+
+        response = client.get("/test-etag/1.0.0/sha256etag/x64-linux")
+        assert "immutable" in response.headers["Cache-Control"]
+        etag = response.headers["ETag"]
+
+        for method in (client.get, client.head):
+            response = method(
+                "/test-etag/1.0.0/sha256etag/x64-linux", headers={"If-None-Match": etag}
+            )
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["ETag"] == etag
+
+        response = client.get(
+            "/test-etag/1.0.0/sha256etag/x64-linux", headers={"If-None-Match": '"stale"'}
+        )
+        assert response.status_code == 200
+        assert response.content == b"data"
+
+
+def test_read_only_rejects_writes(settings):
+    """Test that uploads and deletes are refused in read-only mode."""
+    settings.server.read_only = True
+
+    with TestClient(create_app(settings)) as client:
+        response = client.put("/test-ro/1.0.0/sha256ro/x64-linux", content=b"data")
+        assert response.status_code == 403
+        assert response.json()["detail"] == "Server is in read-only mode"
+
+        response = client.delete("/test-ro/1.0.0/sha256ro/x64-linux")
+        assert response.status_code == 403
+
+
+def test_write_only_hides_downloads(settings):
+    """Test that write-only mode refuses downloads but still confirms a client's copy."""
+    settings.server.write_only = True
+
+    with TestClient(create_app(settings)) as client:
+        response = client.put("/test-wo/1.0.0/sha256wo/x64-linux", content=b"data")
+        etag = f'"{response.json()["etag"]}"'
+
+        assert client.get("/test-wo/1.0.0/sha256wo/x64-linux").status_code == 404
+        response = client.get("/test-wo/1.0.0/sha256wo/x64-linux", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+def test_download_package_larger_than_chunk(settings):
+    """Test that downloads spanning several storage chunks arrive intact."""
+    settings.storage.chunk_size = 1024
+    test_data = bytes(range(256)) * 20
+
+    with TestClient(create_app(settings)) as client:
+        client.put("/test-big/1.0.0/sha256big/x64-linux", content=test_data)
+        response = client.get("/test-big/1.0.0/sha256big/x64-linux")
+
+    assert response.status_code == 200
+    assert response.content == test_data
+
+
+@pytest.mark.parametrize("headers", [{}, {"If-None-Match": '"stale"'}])
+def test_download_of_vanished_package(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, headers: dict[str, str]
+):
+    """Test that a package removed just before it is sent is reported as 404, not 500."""
+    client.put("/test-gone/1.0.0/sha256gone/x64-linux", content=b"data")
+    storage = client.app.state.storage  # type: ignore[attr-defined]
+    assert client.head("/test-gone/1.0.0/sha256gone/x64-linux").status_code == 200
+
+    # Simulate a delete by another worker right before the file is opened
+    resolve_path = storage.resolve_path
+
+    def resolve_then_remove(*args: str) -> str:
+        path = resolve_path(*args)
+        os.remove(path)
+        return path
+
+    monkeypatch.setattr(storage, "resolve_path", resolve_then_remove)
+
+    response = client.get("/test-gone/1.0.0/sha256gone/x64-linux", headers=headers)
+    assert response.status_code == 404
+
+
+def test_conditional_download_skips_the_file(client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    """Test that a 304 is answered from the package info without locating the file."""
+    response = client.put("/test-304/1.0.0/sha256nm/x64-linux", content=b"data")
+    etag = f'"{response.json()["etag"]}"'
+    storage = client.app.state.storage  # type: ignore[attr-defined]
+
+    def fail(*args: str) -> str:
+        raise AssertionError("file located for a 304")
+
+    monkeypatch.setattr(storage, "resolve_path", fail)
+
+    response = client.get("/test-304/1.0.0/sha256nm/x64-linux", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/%2E%2E/%2E%2E/sha256abc/x64-linux",
+        "/test-package/1.0.0/sha256abc/.x64-linux.part",
+        "/test-package/1.0.0/sha256abc/x64%5Clinux",
+    ],
+)
+def test_rejects_unsafe_path_segments(routing_client: TestClient, path: str):
+    """Test that path segments which could escape the storage layout are refused."""
+    assert routing_client.get(path).status_code == 422
+    assert routing_client.put(path, content=b"data").status_code == 422
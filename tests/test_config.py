@@ -30,6 +30,7 @@ def test_default_storage_settings():
     settings = StorageSettings(_env_file=None)
     assert settings.type == "filesystem"
     assert settings.path == "./cache"
+    assert settings.chunk_size == 1024 * 1024
 
 
 def test_default_minio_settings():
@@ -71,8 +72,10 @@ def test_get_storage_config():
     config = settings.get_storage_config()
     assert "endpoint" in config
     assert "bucket" in config
+    assert config["chunk_size"] == settings.storage.chunk_size
 
     # Filesystem config
     settings.storage.type = "filesystem"
     config = settings.get_storage_config()
     assert "path" in config
+    assert config["chunk_size"] == settings.storage.chunk_size
@@ -0,0 +1,149 @@
+"""Tests for the filesystem storage backend."""
+
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from tests.helpers import chunk_stream
+from vcpkg_harbor.core.exceptions import (
+    PackageAlreadyExistsError,
+    PackageNotFoundError,
+    StorageError,
+)
+from vcpkg_harbor.storage.backends.filesystem import FilesystemBackend
+
+
+async def _failing_stream() -> AsyncIterator[bytes]:
+    yield b"partial"
+    raise RuntimeError("client disconnected")
+
+
+@pytest.fixture(params=[True, False], ids=["o_tmpfile", "named_temp"])
+async def backend(request: pytest.FixtureRequest, tmp_path: Path) -> FilesystemBackend:
+    backend = FilesystemBackend(path=str(tmp_path))
+    backend._use_tmpfile = backend._use_tmpfile and request.param
+    await backend.initialize()
+    return backend
+
+
+async def test_put_leaves_no_temp_files(backend: FilesystemBackend):
+    """Test that a completed upload only leaves the package file behind."""
+    info = await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"foo", b"bar"))
+
+    assert info.size == 6
+    sha_dir = backend.base_path / "zlib" / "1.3" / "abc123"
+    assert [p.name for p in sha_dir.iterdir()] == ["x64-linux"]
+    assert (sha_dir / "x64-linux").read_bytes() == b"foobar"
+
+
+async def test_failed_put_is_not_visible(backend: FilesystemBackend):
+    """Test that an interrupted upload never becomes a visible package."""
+    with pytest.raises(StorageError):
+        await backend.put("zlib", "1.3", "abc123", "x64-linux", _failing_stream())
+
+    assert not await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+    assert await backend.list_packages() == []
+    sha_dir = backend.base_path / "zlib" / "1.3" / "abc123"
+    assert list(sha_dir.iterdir()) == []
+
+
+async def test_put_many_small_chunks(backend: FilesystemBackend):
+    """Test that batched writes preserve content across many small chunks."""
+    parts = [bytes([i]) * (i + 1) for i in range(200)]
+    backend.chunk_size = 1024
+
+    info = await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(*parts))
+
+    expected = b"".join(parts)
+    assert info.size == len(expected)
+    chunks = [c async for c in backend.get("zlib", "1.3", "abc123", "x64-linux")]
+    assert b"".join(chunks) == expected
+
+
+async def test_exists_tracks_put_and_delete(backend: FilesystemBackend):
+    """Test that cached existence follows uploads and deletions."""
+    assert not await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+
+    await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"data"))
+    assert await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+
+    assert await backend.delete("zlib", "1.3", "abc123", "x64-linux")
+    assert not await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+
+
+async def test_exists_recovers_from_external_removal(backend: FilesystemBackend):
+    """Test that a package removed behind the backend's back stops being reported."""
+    await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"data"))
+    (backend.base_path / "zlib" / "1.3" / "abc123" / "x64-linux").unlink()
+
+    with pytest.raises(PackageNotFoundError):
+        await backend.stat("zlib", "1.3", "abc123", "x64-linux")
+    assert not await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+
+
+async def test_delete_by_another_instance(tmp_path: Path):
+    """Test that a package deleted by another process can be uploaded again."""
+    first = FilesystemBackend(path=str(tmp_path))
+    second = FilesystemBackend(path=str(tmp_path))
+
+    await first.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"data"))
+    assert await second.exists("zlib", "1.3", "abc123", "x64-linux")
+    assert await first.delete("zlib", "1.3", "abc123", "x64-linux")
+
+    # The cached sighting in the second instance must not block the upload
+    await second.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"again"))
+    assert (await first.stat("zlib", "1.3", "abc123", "x64-linux")).size == 5
+    with pytest.raises(PackageAlreadyExistsError):
+        await first.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"third"))
+
+
+async def test_delete_prunes_only_empty_dirs(backend: FilesystemBackend):
+    """Test that delete removes emptied parents but keeps shared ones."""
+    await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"a"))
+    await backend.put("zlib", "1.3", "def456", "x64-linux", chunk_stream(b"b"))
+
+    assert await backend.delete("zlib", "1.3", "abc123", "x64-linux")
+
+    assert not (backend.base_path / "zlib" / "1.3" / "abc123").exists()
+    assert (backend.base_path / "zlib" / "1.3" / "def456" / "x64-linux").exists()
+    assert backend.base_path.exists()
+
+
+async def test_stat_sees_removal_after_cached_hit(backend: FilesystemBackend):
+    """Test that a package removed after being stat'ed is not served from cache."""
+    await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"data"))
+    await backend.stat("zlib", "1.3", "abc123", "x64-linux")
+    (backend.base_path / "zlib" / "1.3" / "abc123" / "x64-linux").unlink()
+
+    with pytest.raises(PackageNotFoundError):
+        await backend.stat("zlib", "1.3", "abc123", "x64-linux")
+    assert not await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+    await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"again"))
+    assert (await backend.stat("zlib", "1.3", "abc123", "x64-linux")).size == 5
+
+
+async def test_cached_existence_expires(backend: FilesystemBackend):
+    """Test that a cached sighting is only trusted until its TTL has passed."""
+    await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"data"))
+    path = backend.base_path / "zlib" / "1.3" / "abc123" / "x64-linux"
+    path.unlink()
+    assert await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+
+    backend._known_paths[str(path)] = time.monotonic() - 1
+    assert not await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+
+
+async def test_list_packages_order_and_paging(backend: FilesystemBackend):
+    """Test that listing is sorted and honours prefix, offset and limit."""
+    for name, triplet in [("zlib", "x64-linux"), ("curl", "x64-linux"), ("zlib", "arm64-osx")]:
+        await backend.put(name, "1.0", "abc123", triplet, chunk_stream(b"data"))
+
+    listed = [(p.name, p.triplet) for p in await backend.list_packages()]
+    assert listed == [("curl", "x64-linux"), ("zlib", "arm64-osx"), ("zlib", "x64-linux")]
+
+    paged = await backend.list_packages(limit=1, offset=1)
+    assert [(p.name, p.triplet) for p in paged] == [("zlib", "arm64-osx")]
+
+    assert {p.name for p in await backend.list_packages(prefix="zl")} == {"zlib"}
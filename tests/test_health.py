@@ -36,3 +36,10 @@ def test_health_details_endpoint(client: TestClient):
     assert "storage" in data
     assert "cache" in data
     assert "requests" in data
+
+
+def test_metrics_endpoint(client: TestClient):
+    """Test Prometheus metrics endpoint."""
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
@@ -0,0 +1,108 @@
+"""Tests for the local disk cache in front of remote backends."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.helpers import chunk_stream
+from vcpkg_harbor.core.config import Settings
+from vcpkg_harbor.storage import get_storage_backend
+from vcpkg_harbor.storage.backends.filesystem import FilesystemBackend
+from vcpkg_harbor.storage.local_cache import LocalCacheBackend
+
+
+async def _read(cache: LocalCacheBackend, name: str) -> bytes:
+    return b"".join([c async for c in cache.get(name, "1.0", "abc123", "x64-linux")])
+
+
+@pytest.fixture
+async def cache(tmp_path: Path) -> LocalCacheBackend:
+    remote = FilesystemBackend(path=str(tmp_path / "remote"), chunk_size=4)
+    cache = LocalCacheBackend(remote, path=str(tmp_path / "local"), max_size=100, chunk_size=4)
+    await cache.initialize()
+    return cache
+
+
+async def test_download_fills_cache(cache: LocalCacheBackend):
+    """Test that a download is kept locally and later served from disk."""
+    await cache.put("zlib", "1.0", "abc123", "x64-linux", chunk_stream(b"package data"))
+    assert cache.resolve_path("zlib", "1.0", "abc123", "x64-linux") is None
+
+    assert await _read(cache, "zlib") == b"package data"
+
+    path = cache.resolve_path("zlib", "1.0", "abc123", "x64-linux")
+    assert path is not None
+    assert Path(path).read_bytes() == b"package data"
+
+    # Served locally even once the remote copy is gone
+    os.remove(cache.backend.resolve_path("zlib", "1.0", "abc123", "x64-linux"))  # type: ignore[attr-defined]
+    assert await _read(cache, "zlib") == b"package data"
+
+
+async def test_interrupted_download_is_not_cached(cache: LocalCacheBackend):
+    """Test that an abandoned download leaves neither a package nor a temp file."""
+    await cache.put("zlib", "1.0", "abc123", "x64-linux", chunk_stream(b"package data"))
+
+    stream = cache.get("zlib", "1.0", "abc123", "x64-linux")
+    await anext(stream)
+    await stream.aclose()  # type: ignore[attr-defined]
+
+    assert cache.resolve_path("zlib", "1.0", "abc123", "x64-linux") is None
+    sha_dir = cache.base_path / "zlib" / "1.0" / "abc123"
+    assert list(sha_dir.iterdir()) == []
+
+
+async def test_least_recently_used_are_evicted(cache: LocalCacheBackend):
+    """Test that filling past capacity evicts the least recently used packages."""
+    for name in ("a", "b", "c"):
+        await cache.put(name, "1.0", "abc123", "x64-linux", chunk_stream(b"x" * 40))
+
+    await _read(cache, "a")
+    await _read(cache, "b")
+    # Make "a" the most recently used before "c" overflows the cache
+    os.utime(cache.resolve_path("b", "1.0", "abc123", "x64-linux"), (0, 0))  # type: ignore[arg-type]
+    cache.resolve_path("a", "1.0", "abc123", "x64-linux")
+    await _read(cache, "c")
+    await cache.close()
+
+    assert cache.resolve_path("a", "1.0", "abc123", "x64-linux") is not None
+    assert cache.resolve_path("b", "1.0", "abc123", "x64-linux") is None
+    assert cache.resolve_path("c", "1.0", "abc123", "x64-linux") is not None
+    assert not (cache.base_path / "b").exists()
+
+
+async def test_delete_drops_local_copy(cache: LocalCacheBackend):
+    """Test that deleting a package also removes it from the local cache."""
+    await cache.put("zlib", "1.0", "abc123", "x64-linux", chunk_stream(b"package data"))
+    await _read(cache, "zlib")
+
+    assert cache._size == len(b"package data")
+    assert await cache.delete("zlib", "1.0", "abc123", "x64-linux")
+
+    assert cache.resolve_path("zlib", "1.0", "abc123", "x64-linux") is None
+    assert not await cache.exists("zlib", "1.0", "abc123", "x64-linux")
+    assert cache._size == 0
+    assert list(cache.base_path.iterdir()) == []
+
+
+async def test_stat_served_locally_on_hit(cache: LocalCacheBackend):
+    """Test that a cached package is stat'ed without asking the backend."""
+    uploaded = await cache.put("zlib", "1.0", "abc123", "x64-linux", chunk_stream(b"package data"))
+    miss = await cache.stat("zlib", "1.0", "abc123", "x64-linux")
+    await _read(cache, "zlib")
+
+    os.remove(cache.backend.resolve_path("zlib", "1.0", "abc123", "x64-linux"))  # type: ignore[attr-defined]
+    hit = await cache.stat("zlib", "1.0", "abc123", "x64-linux")
+
+    assert hit.size == len(b"package data")
+    assert hit.etag == miss.etag == uploaded.etag
+
+
+def test_registry_wraps_remote_backends(tmp_path: Path):
+    """Test that a configured local cache wraps remote but not filesystem storage."""
+    settings = Settings(storage={"type": "minio", "local_cache_path": str(tmp_path)})
+    assert isinstance(get_storage_backend(settings), LocalCacheBackend)
+
+    settings.storage.type = "filesystem"
+    assert isinstance(get_storage_backend(settings), FilesystemBackend)
@@ -0,0 +1,48 @@
+"""Tests for logging configuration."""
+
+import json
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import structlog
+
+from vcpkg_harbor.core.config import Settings
+from vcpkg_harbor.core.logging import setup_logging
+
+
+@pytest.fixture
+def restore_logging() -> Iterator[None]:
+    """Undo setup_logging(), so its configuration does not leak into later tests."""
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    levels = {
+        name: logging.getLogger(name).level for name in ("", "uvicorn.access", "uvicorn.error")
+    }
+
+    yield
+
+    structlog.reset_defaults()
+    for handler in root.handlers[:]:
+        if handler not in handlers:
+            root.removeHandler(handler)
+            handler.close()
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+
+@pytest.mark.usefixtures("restore_logging")
+def test_json_file_logging_writes_valid_json(tmp_path: Path):
+    """Test that JSON file logs stay valid when messages contain quotes."""
+    log_file = tmp_path / "harbor.log"
+
+    setup_logging(Settings(logging={"json": True, "file": str(log_file)}))
+    logging.getLogger("uvicorn.error").warning('bad "value"')
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+    record = json.loads(log_file.read_text().splitlines()[-1])
+    assert record["event"] == 'bad "value"'
+    assert record["level"] == "warning"
+    assert record["logger"] == "uvicorn.error"
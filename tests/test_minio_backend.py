@@ -0,0 +1,311 @@
+"""Tests for the MinIO storage backend upload path."""
+
+import random
+import time
+import tracemalloc
+from io import BytesIO
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from minio.error import S3Error
+
+from tests.helpers import chunk_stream
+from vcpkg_harbor.core.exceptions import PackageNotFoundError, StorageError
+from vcpkg_harbor.storage.backends.minio import MinioBackend
+
+PART_SIZE = 5 * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+
+class FakeMinio:
+    """In-memory stand-in for the subset of the MinIO client used by uploads."""
+
+    def __init__(self, fail_part: int | None = None) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.aborted: list[str] = []
+        self.fail_part = fail_part
+        self.stat_calls = 0
+        self.listed = 0
+
+    def stat_object(self, bucket: str, name: str) -> Any:
+        self.stat_calls += 1
+        if name not in self.objects:
+            raise S3Error(None, "NoSuchKey", "missing", name, "", "")  # type: ignore[arg-type]
+        return SimpleNamespace(
+            size=len(self.objects[name]), etag="etag", content_type=None, last_modified=None
+        )
+
+    def get_object(self, bucket: str, name: str) -> Any:
+        stream = BytesIO(self.objects[name])
+        return SimpleNamespace(read=stream.read, close=stream.close, release_conn=lambda: None)
+
+    def put_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: BytesIO,
+        length: int,
+        part_size: int = 0,
+        **_: Any,
+    ) -> Any:
+        # The real client splits bodies over 5 MiB unless part_size covers them
+        assert length <= (part_size or 5 * 1024 * 1024), "put_object would split the body"
+        self.objects[object_name] = data.read()
+        return SimpleNamespace(etag="single")
+
+    def list_objects(self, bucket: str, prefix: str | None = None, **_: Any) -> Any:
+        for name in sorted(self.objects):
+            if prefix and not name.startswith(prefix):
+                continue
+            self.listed += 1
+            yield SimpleNamespace(
+                object_name=name, size=len(self.objects[name]), etag="etag", last_modified=None
+            )
+
+    def remove_object(self, bucket: str, name: str) -> None:
+        del self.objects[name]
+
+    def _create_multipart_upload(self, bucket: str, name: str, headers: Any) -> str:
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return upload_id
+
+    def _upload_part(
+        self, bucket: str, name: str, data: bytes, headers: Any, upload_id: str, number: int
+    ) -> str:
+        if number == self.fail_part:
+            raise OSError("connection reset")
+        self.uploads[upload_id][number] = data
+        return f"part-{number}"
+
+    def _complete_multipart_upload(
+        self, bucket: str, name: str, upload_id: str, parts: list[Any]
+    ) -> Any:
+        stored = self.uploads.pop(upload_id)
+        assert [p.part_number for p in parts] == sorted(stored)
+        assert [p.etag for p in parts] == [f"part-{n}" for n in sorted(stored)]
+        self.objects[name] = b"".join(stored[p.part_number] for p in parts)
+        return SimpleNamespace(etag="multipart")
+
+    def _abort_multipart_upload(self, bucket: str, name: str, upload_id: str) -> None:
+        self.uploads.pop(upload_id)
+        self.aborted.append(upload_id)
+
+
+@pytest.fixture(scope="module")
+def payload() -> bytes:
+    """Pseudo-random data shared by the upload tests, generated once.
+
+    Unlike a repeated pattern, it lets a reordered part show up as a mismatch.
+    """
+    return random.Random(0).randbytes(PART_SIZE * 4)
+
+
+def _backend(client: FakeMinio) -> MinioBackend:
+    backend = MinioBackend(part_size=PART_SIZE, max_concurrency=2)
+    backend._client = client  # type: ignore[assignment]
+    return backend
+
+
+async def test_small_upload_uses_single_request():
+    """Test that packages below one part are stored with a plain PUT."""
+    client = FakeMinio()
+    backend = _backend(client)
+
+    info = await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"data"))
+
+    assert info.size == 4
+    assert info.etag == "single"
+    assert client.objects["zlib/1.3/abc123/x64-linux"] == b"data"
+    assert client.uploads == {}
+
+
+async def test_upload_up_to_one_part_uses_single_request(payload: bytes):
+    """Test that a package over 5 MiB but within one part is not split."""
+    client = FakeMinio()
+    backend = _backend(client)
+    backend.part_size = PART_SIZE * 2
+    data = payload[: PART_SIZE + 1]
+
+    info = await backend.put(
+        "zlib", "1.3", "abc123", "x64-linux", chunk_stream(data, size=CHUNK_SIZE)
+    )
+
+    assert info.etag == "single"
+    assert client.objects["zlib/1.3/abc123/x64-linux"] == data
+
+
+async def test_large_upload_is_split_into_ordered_parts(payload: bytes):
+    """Test that large packages are streamed as a multipart upload."""
+    client = FakeMinio()
+    backend = _backend(client)
+    data = payload[: PART_SIZE * 3 + 25_600]
+
+    info = await backend.put(
+        "zlib", "1.3", "abc123", "x64-linux", chunk_stream(data, size=CHUNK_SIZE)
+    )
+
+    assert info.size == len(data)
+    assert info.etag == "multipart"
+    assert client.objects["zlib/1.3/abc123/x64-linux"] == data
+
+
+async def test_failed_part_aborts_upload(payload: bytes):
+    """Test that a failed part aborts the multipart upload."""
+    client = FakeMinio(fail_part=2)
+    backend = _backend(client)
+    data = payload
+
+    with pytest.raises(StorageError):
+        await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(data, size=CHUNK_SIZE))
+
+    assert client.aborted == ["upload-0"]
+    assert "zlib/1.3/abc123/x64-linux" not in client.objects
+
+
+async def test_download_streams_all_chunks():
+    """Test that prefetched downloads return every block in order."""
+    client = FakeMinio()
+    backend = _backend(client)
+    backend.chunk_size = 1000
+    data = bytes(range(256)) * 20
+    client.objects["zlib/1.3/abc123/x64-linux"] = data
+
+    chunks = [c async for c in backend.get("zlib", "1.3", "abc123", "x64-linux")]
+
+    assert b"".join(chunks) == data
+    assert max(len(c) for c in chunks) == 1000
+
+
+async def test_download_can_stop_early():
+    """Test that abandoning a download waits for the in-flight read and closes."""
+    client = FakeMinio()
+    backend = _backend(client)
+    backend.chunk_size = 10
+    client.objects["zlib/1.3/abc123/x64-linux"] = b"x" * 100
+
+    stream = backend.get("zlib", "1.3", "abc123", "x64-linux")
+    assert await anext(stream) == b"x" * 10
+    await stream.aclose()  # type: ignore[attr-defined]
+
+
+async def test_stat_results_are_cached():
+    """Test that repeated lookups, hits and misses, reuse one stat_object call."""
+    client = FakeMinio()
+    backend = _backend(client)
+    client.objects["zlib/1.3/abc123/x64-linux"] = b"data"
+
+    for _ in range(3):
+        assert (await backend.stat("zlib", "1.3", "abc123", "x64-linux")).size == 4
+        assert not await backend.exists("curl", "8.0", "abc123", "x64-linux")
+
+    assert client.stat_calls == 2
+
+
+async def test_cached_miss_expires_quickly():
+    """Test that a cached miss is kept for seconds, not the full stat TTL."""
+    client = FakeMinio()
+    backend = _backend(client)
+    path = "zlib/1.3/abc123/x64-linux"
+
+    assert not await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+    client.objects[path] = b"uploaded elsewhere"
+    assert not await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+
+    expires, _ = backend._stat_cache[path]
+    assert expires - time.monotonic() <= 2
+    backend._stat_cache[path] = (time.monotonic() - 1, None)
+    assert await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+
+    await backend.stat("zlib", "1.3", "abc123", "x64-linux")
+    expires, _ = backend._stat_cache[path]
+    assert expires - time.monotonic() > 50
+
+
+async def test_stat_cache_follows_put_and_delete():
+    """Test that uploads and deletions update cached lookups."""
+    client = FakeMinio()
+    backend = _backend(client)
+
+    assert not await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+    await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"data"))
+    assert await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+
+    assert await backend.delete("zlib", "1.3", "abc123", "x64-linux")
+    assert not await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+    with pytest.raises(PackageNotFoundError):
+        await backend.stat("zlib", "1.3", "abc123", "x64-linux")
+
+
+async def test_put_ignores_cached_hit():
+    """Test that an object deleted behind the stat cache can be uploaded again."""
+    client = FakeMinio()
+    backend = _backend(client)
+
+    await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"data"))
+    assert await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+    del client.objects["zlib/1.3/abc123/x64-linux"]
+
+    await backend.put("zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"again"))
+    assert client.objects["zlib/1.3/abc123/x64-linux"] == b"again"
+
+
+async def test_delete_ignores_cached_miss():
+    """Test that delete re-checks MinIO instead of trusting a cached miss."""
+    client = FakeMinio()
+    backend = _backend(client)
+
+    assert not await backend.exists("zlib", "1.3", "abc123", "x64-linux")
+    client.objects["zlib/1.3/abc123/x64-linux"] = b"uploaded elsewhere"
+
+    assert await backend.delete("zlib", "1.3", "abc123", "x64-linux")
+    assert client.objects == {}
+
+
+@pytest.mark.parametrize("size_hint", [None, 0, 1000, PART_SIZE * 2 + 7, PART_SIZE * 9])
+async def test_upload_with_size_hint(payload: bytes, size_hint: int | None):
+    """Test that the declared Content-Length does not affect what is stored."""
+    client = FakeMinio()
+    backend = _backend(client)
+    data = payload[: PART_SIZE * 2 + 11]
+
+    info = await backend.put(
+        "zlib", "1.3", "abc123", "x64-linux", chunk_stream(data, size=CHUNK_SIZE), size_hint
+    )
+
+    assert info.size == len(data)
+    assert client.objects["zlib/1.3/abc123/x64-linux"] == data
+
+
+async def test_size_hint_does_not_reserve_a_whole_part():
+    """Test that a huge Content-Length does not allocate a part before data arrives."""
+    client = FakeMinio()
+    backend = _backend(client)
+    backend.part_size = PART_SIZE * 20
+
+    tracemalloc.start()
+    try:
+        await backend.put(
+            "zlib", "1.3", "abc123", "x64-linux", chunk_stream(b"data"), PART_SIZE * 20
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < PART_SIZE
+    assert client.objects["zlib/1.3/abc123/x64-linux"] == b"data"
+
+
+async def test_list_packages_stops_at_limit():
+    """Test that a limited listing stops consuming the bucket listing early."""
+    client = FakeMinio()
+    backend = _backend(client)
+    for i in range(50):
+        client.objects[f"pkg{i:02d}/1.0/abc123/x64-linux"] = b"data"
+
+    page = await backend.list_packages(limit=2, offset=3)
+
+    assert [p.name for p in page] == ["pkg03", "pkg04"]
+    assert client.listed == 5